@@ -1,15 +1,21 @@
 """Generic rivalry analysis - analyze any two people."""
 
 import argparse
-import json
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
-from rivalry_research import search_person, analyze_rivalry
-
 LOG_LEVEL = "DEBUG"
 
+# Copies of each analysis are also written here for convenience
+OUTPUT_DIR = Path(__file__).parent / "output"
+OUTPUT_DIR.mkdir(exist_ok=True)
+
 logger = logging.getLogger(__name__)
 
 def setup_logging(level: str):
@@ -28,11 +34,27 @@ def setup_logging(level: str):
         to:
             level=getattr(logging, level.upper())  # Shows all loggers
     """
+    # Records are handed to a queue and written to stderr by a listener
+    # thread, so logging calls in the pipeline don't block on the write
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+    ))
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler only merges args into the message; the listener's
+    # handler applies the real format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     # Set root logger to WARNING to silence third-party libraries
     logging.basicConfig(
         level=logging.WARNING,  # Only show warnings/errors from third-party libs
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=[queue_handler],
     )
     
     # Set rivalry_research to the requested level (includes all submodules)
@@ -41,6 +63,109 @@ def setup_logging(level: str):
     )
 
 
+def _show_search_results(name: str, results: list):
+    """
+    Log the top search match for a name, plus up to 3 alternatives.
+    
+    Args:
+        name: Name that was searched for
+        results: Search results for the name
+    
+    Returns:
+        The top match, or None if there were no results
+    """
+    if not results:
+        logger.error(f"❌ No results found for '{name}'")
+        return None
+    
+    person = results[0]
+    logger.info(f"✓ {person.label} ({person.id})")
+    if person.description:
+        logger.info(f"  {person.description}")
+    
+    # Show disambiguation options if multiple results
+    if len(results) > 1:
+        logger.info(f"\n  Other matches found ({len(results) - 1}):")
+        alternatives = results[1:4]
+        for i, result in enumerate(alternatives, 2):
+            logger.info(f"    {i}. {result.label} - {result.description}")
+    logger.info("")
+    
+    return person
+
+
+def _format_report(analysis) -> str:
+    """
+    Build the human-readable analysis report.
+    
+    Args:
+        analysis: RivalryAnalysis to describe
+    
+    Returns:
+        Multi-line report text
+    """
+    lines = ["=" * 70, "RIVALRY ANALYSIS", "=" * 70]
+    lines.append(f"\n{analysis.entity1.label} vs {analysis.entity2.label}")
+    lines.append(f"Rivalry: {'YES' if analysis.rivalry_exists else 'NO'}")
+    lines.append(f"Score: {analysis.rivalry_score:.2f}/1.00")
+    
+    if analysis.rivalry_period_start or analysis.rivalry_period_end:
+        period_start = analysis.rivalry_period_start or "?"
+        period_end = analysis.rivalry_period_end or "ongoing"
+        lines.append(f"Period: {period_start} - {period_end}")
+    
+    lines.append(f"\n📝 Summary:\n{analysis.summary}")
+    
+    # Show source information
+    if analysis.sources:
+        lines.append(f"\n📚 Sources ({len(analysis.sources)} total):")
+        for source_id, source in islice(analysis.sources.items(), 5):  # Show first 5
+            lines.append(f"  • {source.title}")
+            lines.append(f"    Type: {source.type}, Credibility: {source.credibility_score:.2f}")
+        if len(analysis.sources) > 5:
+            lines.append(f"  ... and {len(analysis.sources) - 5} more sources")
+    
+    # Show entity biographical info
+    lines.append(f"\n👤 {analysis.entity1.label}:")
+    if analysis.entity1.birth_date:
+        lines.append(f"   Born: {analysis.entity1.birth_date}")
+    if analysis.entity1.death_date:
+        lines.append(f"   Died: {analysis.entity1.death_date}")
+    
+    lines.append(f"\n👤 {analysis.entity2.label}:")
+    if analysis.entity2.birth_date:
+        lines.append(f"   Born: {analysis.entity2.birth_date}")
+    if analysis.entity2.death_date:
+        lines.append(f"   Died: {analysis.entity2.death_date}")
+    
+    if analysis.timeline:
+        lines.append(f"\n📅 Rivalry Timeline ({len(analysis.timeline)} events):")
+        for event in analysis.timeline:
+            lines.append(f"\n  {event.date} [{event.rivalry_relevance.upper()}]")
+            lines.append(f"    {event.description}")
+            
+            # Display direct quotes if present
+            if event.direct_quotes:
+                for quote in event.direct_quotes:
+                    lines.append(f"    💬 {quote}")
+            
+            # Display source information
+            if event.sources:
+                lines.append(f"    📖 Sources: {event.source_count} (Confidence: {event.confidence:.2f})")
+            
+            lines.append(f"    Entity: {event.entity_id}")
+    
+    if analysis.relationships:
+        lines.append(f"\n🔗 Wikidata Relationships ({len(analysis.relationships)}):")
+        for rel in analysis.relationships:
+            target = rel.target_entity_label or rel.value
+            lines.append(f"  • {rel.property_label}: {target}")
+    
+    lines.append("\n" + "=" * 70)
+    
+    return "\n".join(lines)
+
+
 def main():
     """Analyze rivalry between any two people provided as arguments."""
     
@@ -67,52 +192,41 @@ def main():
     # Setup logging BEFORE importing/using the library
     setup_logging(args.log_level)
     
+    run_analysis(args.person1, args.person2)
+
+
+def run_analysis(person1_name: str, person2_name: str):
+    """
+    Search for two people, analyze their rivalry and report the result.
+    
+    Shared with the other example scripts; call setup_logging first.
+    
+    Args:
+        person1_name: First person's name
+        person2_name: Second person's name
+    """
     if not os.getenv("GOOGLE_API_KEY"):
         logger.error("⚠️  Set GOOGLE_API_KEY environment variable")
         return
     
-    person1_name = args.person1
-    person2_name = args.person2
+    # Imported here so --help and a missing API key don't pay for loading
+    # the library and its SDK dependencies
+    from rivalry_research import search_person, analyze_rivalry
     
     logger.info(f"🔍 Rivalry Research - {person1_name} vs {person2_name}\n")
     
-    # Search for first person
-    logger.info(f"Searching for '{person1_name}'...")
-    results1 = search_person(person1_name)
-    if not results1:
-        logger.error(f"❌ No results found for '{person1_name}'")
-        return
-    
-    person1 = results1[0]
-    logger.info(f"✓ {person1.label} ({person1.id})")
-    if person1.description:
-        logger.info(f"  {person1.description}")
+    # Search for both people concurrently (independent network calls)
+    logger.info(f"Searching for '{person1_name}' and '{person2_name}'...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results1, results2 = executor.map(search_person, (person1_name, person2_name))
     
-    # Show disambiguation options if multiple results
-    if len(results1) > 1:
-        logger.info(f"\n  Other matches found ({len(results1) - 1}):")
-        for i, result in enumerate(results1[1:4], 2):
-            logger.info(f"    {i}. {result.label} - {result.description}")
-    logger.info("")
-    
-    # Search for second person
-    logger.info(f"Searching for '{person2_name}'...")
-    results2 = search_person(person2_name)
-    if not results2:
-        logger.error(f"❌ No results found for '{person2_name}'")
+    person1 = _show_search_results(person1_name, results1)
+    if person1 is None:
         return
     
-    person2 = results2[0]
-    logger.info(f"✓ {person2.label} ({person2.id})")
-    if person2.description:
-        logger.info(f"  {person2.description}")
-    
-    # Show disambiguation options if multiple results
-    if len(results2) > 1:
-        logger.info(f"\n  Other matches found ({len(results2) - 1}):")
-        for i, result in enumerate(results2[1:4], 2):
-            logger.info(f"    {i}. {result.label} - {result.description}")
-    logger.info("")
+    person2 = _show_search_results(person2_name, results2)
+    if person2 is None:
+        return
     
     # Analyze rivalry
     logger.info("Analyzing rivalry...\n")
@@ -120,78 +234,21 @@ def main():
     try:
         analysis = analyze_rivalry(person1.id, person2.id)
         
-        logger.info("=" * 70)
-        logger.info("RIVALRY ANALYSIS")
-        logger.info("=" * 70)
-        logger.info(f"\n{analysis.entity1.label} vs {analysis.entity2.label}")
-        logger.info(f"Rivalry: {'YES' if analysis.rivalry_exists else 'NO'}")
-        logger.info(f"Score: {analysis.rivalry_score:.2f}/1.00")
-        
-        if analysis.rivalry_period_start or analysis.rivalry_period_end:
-            period_start = analysis.rivalry_period_start or "?"
-            period_end = analysis.rivalry_period_end or "ongoing"
-            logger.info(f"Period: {period_start} - {period_end}")
-        
-        logger.info(f"\n📝 Summary:\n{analysis.summary}")
-        
-        # Show source information
-        if analysis.sources:
-            logger.info(f"\n📚 Sources ({len(analysis.sources)} total):")
-            for source_id, source in list(analysis.sources.items())[:5]:  # Show first 5
-                logger.info(f"  • {source.title}")
-                logger.info(f"    Type: {source.type}, Credibility: {source.credibility_score:.2f}")
-            if len(analysis.sources) > 5:
-                logger.info(f"  ... and {len(analysis.sources) - 5} more sources")
-        
-        # Show entity biographical info
-        logger.info(f"\n👤 {analysis.entity1.label}:")
-        if analysis.entity1.birth_date:
-            logger.info(f"   Born: {analysis.entity1.birth_date}")
-        if analysis.entity1.death_date:
-            logger.info(f"   Died: {analysis.entity1.death_date}")
-        
-        logger.info(f"\n👤 {analysis.entity2.label}:")
-        if analysis.entity2.birth_date:
-            logger.info(f"   Born: {analysis.entity2.birth_date}")
-        if analysis.entity2.death_date:
-            logger.info(f"   Died: {analysis.entity2.death_date}")
-        
-        if analysis.timeline:
-            logger.info(f"\n📅 Rivalry Timeline ({len(analysis.timeline)} events):")
-            for event in analysis.timeline:
-                logger.info(f"\n  {event.date} [{event.rivalry_relevance.upper()}]")
-                logger.info(f"    {event.description}")
-                
-                # Display direct quotes if present
-                if event.direct_quotes:
-                    for quote in event.direct_quotes:
-                        logger.info(f"    💬 {quote}")
-                
-                # Display source information
-                if event.sources:
-                    logger.info(f"    📖 Sources: {event.source_count} (Confidence: {event.confidence:.2f})")
-                
-                logger.info(f"    Entity: {event.entity_id}")
-        
-        if analysis.relationships:
-            logger.info(f"\n🔗 Wikidata Relationships ({len(analysis.relationships)}):")
-            for rel in analysis.relationships:
-                target = rel.target_entity_label or rel.value
-                logger.info(f"  • {rel.property_label}: {target}")
-        
-        logger.info("\n" + "=" * 70)
+        # Emit the report as a single record rather than one per line
+        logger.info(_format_report(analysis))
         
         # Analysis is automatically saved to data/analyses/ by the pipeline
         logger.info(f"\n💾 Analysis automatically saved to: data/analyses/{person1.id}_{person2.id}/analysis.json")
         
         # Also save a copy to examples/output for convenience
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
-        
-        output_file = output_dir / f"{person1.id}_{person2.id}_rivalry_analysis.json"
+        output_file = OUTPUT_DIR / f"{person1.id}_{person2.id}_rivalry_analysis.json"
         
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(analysis.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+        # Serialize straight from the model, without an intermediate dict, and
+        # rename into place so the copy never appears half-written
+        tmp_file = output_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(analysis.model_dump_json(indent=2).encode("utf-8"))
+        os.replace(tmp_file, output_file)
         
         logger.info(f"   Copy saved to: {output_file}")
         
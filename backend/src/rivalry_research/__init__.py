@@ -1,6 +1,9 @@
 """Rivalry Research - Analyze rivalrous relationships using Wikidata and AI."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
 
 import logfire
 
@@ -10,22 +13,24 @@ from .models import (
     Relationship,
     RivalryAnalysis,
     RivalryEntity,
+    Source,
     TimelineEvent,
     WikidataEntity,
 )
 from .config import get_settings
-from .rag.file_search_client import (
-    get_or_create_store,
-    upload_document,
-)
 from .relationships import get_direct_relationships, get_shared_properties
-from .rivalry_agent import analyze_rivalry as analyze_rivalry_with_data
 from .search import get_person_by_id, search_person
-from .sources import fetch_sources_for_entity
-from .storage import save_analysis, SourceDatabase
+from .storage import load_analysis, save_analysis, SourceDatabase
+
+# The File Search client, the AI agent and the source fetchers pull in
+# google-genai, pydantic-ai and the scraping libraries; they are imported
+# inside analyze_rivalry so search-only users don't pay that import cost
 
 logger = logging.getLogger(__name__)
 
+# Concurrent File Search uploads (each blocks while the store imports it)
+_UPLOAD_MAX_WORKERS = 4
+
 # Configure Logfire for console-only observability (no web service)
 logfire.configure(
     send_to_logfire='never',  # Console only, don't send to web
@@ -54,7 +59,12 @@ __all__ = [
 ]
 
 
-def analyze_rivalry(entity_id1: str, entity_id2: str, save_output: bool = True) -> RivalryAnalysis:
+def analyze_rivalry(
+    entity_id1: str,
+    entity_id2: str,
+    save_output: bool = True,
+    force_refresh: bool = False,
+) -> RivalryAnalysis:
     """
     Analyze the rivalry between two people using Wikidata and RAG-enhanced AI.
 
@@ -66,6 +76,9 @@ def analyze_rivalry(entity_id1: str, entity_id2: str, save_output: bool = True)
     5. Uses AI with File Search to analyze rivalry with comprehensive context
     6. Saves analysis to disk with full source catalog
 
+    If a saved analysis for the pair is younger than the configured
+    analysis_max_age_days, it is returned instead and nothing is fetched.
+
     The AI agent has access to both structured Wikidata facts and the full text of
     all collected documents (Wikipedia + academic papers), enabling deeper analysis.
     Sources are automatically deduplicated and tracked.
@@ -74,6 +87,7 @@ def analyze_rivalry(entity_id1: str, entity_id2: str, save_output: bool = True)
         entity_id1: First person's Wikidata entity ID (e.g., "Q935" for Newton)
         entity_id2: Second person's Wikidata entity ID (e.g., "Q9047" for Leibniz)
         save_output: Whether to save analysis to disk (default: True)
+        force_refresh: Re-run the analysis even if a recent saved one exists
 
     Returns:
         RivalryAnalysis with structured rivalry data including source catalog
@@ -90,55 +104,170 @@ def analyze_rivalry(entity_id1: str, entity_id2: str, save_output: bool = True)
         >>> print(f"Rivalry score: {analysis.rivalry_score:.2f}")
         >>> print(f"Sources: {len(analysis.sources)} total")
     """
-    logger.info(f"Starting rivalry analysis: {entity_id1} vs {entity_id2}")
+    settings = get_settings()
 
-    # PHASE 1: Fetch Wikidata entities and relationships
-    logger.info("Phase 1: Fetching Wikidata entities")
-    entity1 = get_person_by_id(entity_id1)
-    entity2 = get_person_by_id(entity_id2)
+    if not force_refresh:
+        saved = _load_recent_analysis(
+            f"{entity_id1}_{entity_id2}",
+            settings.analyses_dir,
+            timedelta(days=settings.analysis_max_age_days),
+        )
+        if saved is not None:
+            return saved
 
-    logger.debug(f"Entity 1: {entity1.label} ({entity1.id})")
-    logger.debug(f"  Description: {entity1.description}")
-    logger.debug(f"  Wikipedia: {entity1.wikipedia_url}")
+    from .rag.file_search_client import get_or_create_store
+    from .rivalry_agent import analyze_rivalry as analyze_rivalry_with_data
 
-    logger.debug(f"Entity 2: {entity2.label} ({entity2.id})")
-    logger.debug(f"  Description: {entity2.description}")
-    logger.debug(f"  Wikipedia: {entity2.wikipedia_url}")
+    logger.info("Starting rivalry analysis: %s vs %s", entity_id1, entity_id2)
 
-    logger.info("Fetching relationships and shared properties")
-    relationships = get_direct_relationships(entity_id1, entity_id2)
-    shared_props = get_shared_properties(entity_id1, entity_id2)
+    # PHASE 1: Fetch Wikidata entities and relationships
+    logger.info("Phase 1: Fetching Wikidata entities")
+    # Independent network calls; fetch both entities concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        entity1, entity2 = executor.map(get_person_by_id, (entity_id1, entity_id2))
 
-    logger.debug(f"Found {len(relationships)} direct relationships")
-    logger.debug(f"Found {len(shared_props)} shared properties")
+    if logger.isEnabledFor(logging.DEBUG):
+        for number, entity in enumerate((entity1, entity2), 1):
+            logger.debug("Entity %d: %s (%s)", number, entity.label, entity.id)
+            logger.debug("  Description: %s", entity.description)
+            logger.debug("  Wikipedia: %s", entity.wikipedia_url)
 
     # PHASE 2: Fetch Sources & Prepare File Search
-    logger.info("Phase 2: Fetching sources and preparing File Search")
-    settings = get_settings()
-    store = get_or_create_store()
+    # Relationships, the File Search store and the sources only depend on the
+    # entities, so they are fetched concurrently. Both entities' sources are
+    # fetched in a single worker since they share the database and the
+    # Wikipedia rate limiter
+    logger.info("Phase 2: Fetching relationships and sources, preparing File Search")
     db = SourceDatabase(settings.sources_db_path)
 
-    # Fetch all sources for both entities
-    logger.info("Fetching comprehensive sources (Wiki, Scholar, arXiv)")
-    sources_1_tuples = fetch_sources_for_entity(db, settings.raw_sources_dir, entity1)
-    sources_2_tuples = fetch_sources_for_entity(db, settings.raw_sources_dir, entity2)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        relationships_future = executor.submit(
+            get_direct_relationships, entity_id1, entity_id2
+        )
+        shared_props_future = executor.submit(
+            get_shared_properties, entity_id1, entity_id2
+        )
+        store_future = executor.submit(get_or_create_store)
+        logger.info("Fetching comprehensive sources (Wiki, Scholar, arXiv)")
+        sources_future = executor.submit(
+            _fetch_sources_for_entities, db, settings.raw_sources_dir, entity1, entity2
+        )
+
+        relationships = relationships_future.result()
+        shared_props = shared_props_future.result()
+        store = store_future.result()
+        all_source_tuples = sources_future.result()
+
+    logger.debug("Found %d direct relationships", len(relationships))
+    logger.debug("Found %d shared properties", len(shared_props))
     
-    all_source_tuples = sources_1_tuples + sources_2_tuples
     all_sources_list = [t[0] for t in all_source_tuples]
     
     # Count sources by origin
     manual_sources = sum(1 for s in all_sources_list if s.is_manual)
     auto_sources = len(all_sources_list) - manual_sources
     
-    logger.info(f"Collected {len(all_sources_list)} total sources")
-    logger.info(f"Source breakdown: {manual_sources} manual, {auto_sources} auto-fetched")
+    logger.info("Collected %d total sources", len(all_sources_list))
+    logger.info("Source breakdown: %d manual, %d auto-fetched", manual_sources, auto_sources)
     
     # Upload content to File Search
+    _upload_sources(store.name, all_source_tuples)
+
+    # The agent reads source text from the store, so release the local copies
+    # rather than holding every article in memory through the AI phase
+    all_source_tuples.clear()
+
+    # PHASE 3: AI analysis with File Search
+    logger.info("Phase 3: Running AI analysis with pre-fetched sources")
+    analysis = analyze_rivalry_with_data(
+        entity1, entity2, relationships, shared_props, 
+        store_name=store.name,
+        sources=all_sources_list
+    )
+
+    logger.info(
+        "Analysis complete: rivalry=%s, score=%.2f, sources=%d",
+        "YES" if analysis.rivalry_exists else "NO",
+        analysis.rivalry_score,
+        len(analysis.sources),
+    )
+
+    # PHASE 4: Save analysis
+    if save_output:
+        output_path = save_analysis(analysis, settings.analyses_dir)
+        logger.info("Saved analysis to %s", output_path)
+
+    return analysis
+
+
+def _fetch_sources_for_entities(
+    db: SourceDatabase,
+    raw_sources_dir: Path,
+    entity1: WikidataEntity,
+    entity2: WikidataEntity,
+) -> list[tuple[Source, str]]:
+    """Fetch sources for both entities, one after the other."""
+    from .sources import fetch_sources_for_entity
+
+    return (
+        fetch_sources_for_entity(db, raw_sources_dir, entity1)
+        + fetch_sources_for_entity(db, raw_sources_dir, entity2)
+    )
+
+
+def _load_recent_analysis(
+    analysis_id: str, analyses_dir: Path, max_age: timedelta
+) -> RivalryAnalysis | None:
+    """
+    Load a saved analysis if it is recent enough to reuse.
+
+    Args:
+        analysis_id: Analysis identifier (e.g., "Q935_Q9047")
+        analyses_dir: Base directory for analyses storage
+        max_age: Maximum age of a reusable analysis
+
+    Returns:
+        The saved analysis, or None if missing, unreadable or too old
+    """
+    try:
+        analysis = load_analysis(analysis_id, analyses_dir)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable saved analysis %s: %s", analysis_id, e)
+        return None
+
+    age = datetime.now(analysis.analyzed_at.tzinfo) - analysis.analyzed_at
+    if age > max_age:
+        logger.info("Saved analysis %s is %s old, re-running", analysis_id, age)
+        return None
+
+    logger.info("Using saved analysis %s from %s", analysis_id, analysis.analyzed_at)
+    return analysis
+
+
+def _upload_sources(store_name: str, source_tuples: list[tuple[Source, str]]) -> None:
+    """
+    Upload source content to a File Search store.
+
+    Args:
+        store_name: File Search store resource name
+        source_tuples: (Source, content) pairs to upload
+    """
+    from .rag.file_search_client import upload_document
+
     logger.info("Uploading source content to File Search store")
-    for source, content in all_source_tuples:
-        # Check if already uploaded (using source ID or URL hash might be better, 
-        # but here we use a simple check or just allow update)
-        # Note: check_document_exists is currently a stub that returns False
+    # The store is created fresh for each analysis, so the only documents
+    # already in it are ones uploaded by this loop. A source found for both
+    # entities (deduplicated by URL) would otherwise be uploaded twice
+    uploaded_ids: set[str] = set()
+    uploads: list[tuple[str, str, dict]] = []
+    for source, content in source_tuples:
+        if source.source_id in uploaded_ids:
+            logger.debug("Skipping duplicate upload of %s", source.source_id)
+            continue
+        uploaded_ids.add(source.source_id)
+        
         # We'll use the source title + ID as display name
         display_name = f"{source.title} ({source.source_id})"
         
@@ -161,34 +290,23 @@ def analyze_rivalry(entity_id1: str, entity_id2: str, save_output: bool = True)
         if source.doi:
             custom_metadata["doi"] = source.doi
         
-        # Upload with metadata
+        uploads.append((display_name, content, custom_metadata))
+
+    def _upload(upload: tuple[str, str, dict]) -> None:
+        display_name, content, custom_metadata = upload
         try:
             upload_document(
-                store.name,
+                store_name,
                 display_name,
                 content,
                 custom_metadata=custom_metadata,
             )
         except Exception as e:
-            logger.warning(f"Failed to upload {display_name} to File Search: {e}")
-
-    # PHASE 3: AI analysis with File Search
-    logger.info("Phase 3: Running AI analysis with pre-fetched sources")
-    analysis = analyze_rivalry_with_data(
-        entity1, entity2, relationships, shared_props, 
-        store_name=store.name,
-        sources=all_sources_list
-    )
+            logger.warning("Failed to upload %s to File Search: %s", display_name, e)
 
-    logger.info(
-        f"Analysis complete: rivalry={'YES' if analysis.rivalry_exists else 'NO'}, "
-        f"score={analysis.rivalry_score:.2f}, sources={len(analysis.sources)}"
-    )
-
-    # PHASE 4: Save analysis
-    if save_output:
-        settings = get_settings()
-        output_path = save_analysis(analysis, settings.analyses_dir)
-        logger.info(f"Saved analysis to {output_path}")
-
-    return analysis
+    # Uploads are independent and mostly spent waiting on the import
+    # operation, so run several at once
+    if uploads:
+        max_workers = min(_UPLOAD_MAX_WORKERS, len(uploads))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_upload, uploads))
@@ -9,6 +9,8 @@ from ..config import get_settings
 
 app = typer.Typer(help="Delete generated data")
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def count_files_recursive(path: Path) -> int:
     """Count all files in a directory recursively."""
@@ -29,11 +31,9 @@ def format_size(path: Path) -> str:
     else:
         size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
     
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} TB"
+    # Each unit is a factor of 2**10, so the bit length picks it directly
+    unit_idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size > 0 else 0
+    return f"{size / (1 << (10 * unit_idx)):.1f} {_SIZE_UNITS[unit_idx]}"
 
 
 def show_what_will_be_deleted(
@@ -1,6 +1,11 @@
 """File Search management commands for Rivalry Research."""
 
 import json
+import re
+import sys
+from collections import namedtuple
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any
 
@@ -8,8 +13,57 @@ import typer
 
 from ..rag import file_search_client
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = typer.Typer(help="File Search store management")
 
+# Stand-in for a store given by name on the command line
+_Store = namedtuple("_Store", ("name", "display_name"))
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Leading date of an ISO 8601 timestamp
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Status markers in the multi-store health-check summary
+_STATUS_ICONS = {"HEALTHY": "✓", "WARNING": "⚠"}
+
+# Markers for document states in list-docs --documents
+_DOCUMENT_STATE_ICONS = {"STATE_ACTIVE": "✓", "STATE_PENDING": "⏳", "STATE_FAILED": "✗"}
+
+# Concurrent store checks in health-check
+_HEALTH_CHECK_MAX_WORKERS = 8
+
+
+def _write_json(data: Any, indent: bool = True) -> None:
+    """
+    Write data to stdout as JSON followed by a newline.
+    
+    With orjson installed the encoded bytes go straight to the binary
+    stdout buffer, skipping the text layer's re-encoding.
+    
+    Args:
+        data: JSON-serializable data
+        indent: Indent with two spaces; otherwise write a single line
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=option))
+        sys.stdout.buffer.flush()
+    else:
+        typer.echo(json.dumps(data, indent=2 if indent else None, default=str))
+
+
+def _flush(lines: list[str]) -> None:
+    """Write buffered output lines to stdout in a single call."""
+    if lines:
+        typer.echo("\n".join(lines))
+
 
 def format_timestamp(timestamp: Any) -> str:
     """Format timestamp for display."""
@@ -17,10 +71,13 @@ def format_timestamp(timestamp: Any) -> str:
         return "N/A"
     
     if isinstance(timestamp, str):
+        # Anything not starting with a date can't be ISO; skip the parse
+        if not _ISO_DATE_RE.match(timestamp):
+            return timestamp
+        iso = timestamp[:-1] + "+00:00" if timestamp.endswith("Z") else timestamp
         try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, AttributeError):
+            return datetime.fromisoformat(iso).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
             return timestamp
     
     return str(timestamp)
@@ -31,23 +88,26 @@ def format_size(size_bytes: int | None) -> str:
     if size_bytes is None:
         return "N/A"
     
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Each unit is a factor of 2**10, so the bit length picks it directly
+    unit_idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size_bytes > 0 else 0
+    return f"{size_bytes / (1 << (10 * unit_idx)):.1f} {_SIZE_UNITS[unit_idx]}"
 
 
 @app.command("list-stores")
 def list_stores(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed information"),
+    limit: int = typer.Option(None, "--limit", "-n", min=1, help="Maximum number of stores to list"),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Output one JSON object per line as results arrive"),
 ) -> None:
     """List all File Search stores."""
+    lines: list[str] = []
+    emit = lines.append
+    
     try:
-        stores = file_search_client.list_stores()
+        stores = file_search_client.list_stores(limit=limit)
         
-        if json_output:
+        if json_output or ndjson:
             output = []
             for store in stores:
                 store_data = {
@@ -55,35 +115,39 @@ def list_stores(
                     "display_name": getattr(store, "display_name", None),
                     "create_time": getattr(store, "create_time", None),
                 }
-                output.append(store_data)
-            typer.echo(json.dumps(output, indent=2))
+                if ndjson:
+                    _write_json(store_data, indent=False)
+                else:
+                    output.append(store_data)
+            if json_output and not ndjson:
+                _write_json(output)
             return
         
         if not stores:
-            typer.echo("No File Search stores found.")
+            emit("No File Search stores found.")
             return
         
-        typer.echo("\nFile Search Stores:")
-        typer.echo("━" * 70)
+        emit("\nFile Search Stores:")
+        emit("━" * 70)
         
         for store in stores:
             display_name = getattr(store, "display_name", "N/A")
             create_time = getattr(store, "create_time", None)
             
-            typer.echo(f"✓ {store.name}")
-            typer.echo(f"  Name: {display_name}")
-            typer.echo(f"  Created: {format_timestamp(create_time)}")
+            emit(f"✓ {store.name}")
+            emit(f"  Name: {display_name}")
+            emit(f"  Created: {format_timestamp(create_time)}")
             
             if verbose:
                 try:
-                    docs = file_search_client.list_documents(store.name)
-                    typer.echo(f"  Documents: {docs['total']}")
+                    docs = file_search_client.get_document_counts(store)
+                    emit(f"  Documents: {docs['total']}")
                 except Exception as e:
-                    typer.echo(f"  Documents: Error ({e})")
+                    emit(f"  Documents: Error ({e})")
             
-            typer.echo()
+            emit("")
         
-        typer.echo(f"Total: {len(stores)} store{'s' if len(stores) != 1 else ''}")
+        emit(f"Total: {len(stores)} store{'s' if len(stores) != 1 else ''}")
         
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
@@ -92,55 +156,81 @@ def list_stores(
     except Exception as e:
         typer.echo(f"Error listing stores: {e}", err=True)
         raise typer.Exit(1)
+    finally:
+        _flush(lines)
 
 
 @app.command("list-docs")
 def list_docs(
     store_name: str = typer.Argument(None, help="File Search store name (lists all stores if omitted)"),
+    limit: int = typer.Option(None, "--limit", "-n", min=1, help="Maximum number of stores to list"),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Output one JSON object per line as results arrive"),
+    documents: bool = typer.Option(False, "--documents", "-d", help="List individual documents instead of counts"),
 ) -> None:
-    """List document counts in File Search stores."""
+    """List document counts (or documents) in File Search stores."""
+    lines: list[str] = []
+    emit = lines.append
+    
     try:
         if store_name:
-            stores = [type("Store", (), {"name": store_name})()]
+            stores = [_Store(name=store_name, display_name=None)]
         else:
-            stores = file_search_client.list_stores()
+            stores = file_search_client.list_stores(limit=limit)
             if not stores:
-                typer.echo("No File Search stores found.")
+                emit("No File Search stores found.")
                 return
         
+        if documents:
+            _list_store_documents(stores, emit, json_output, ndjson)
+            return
+        
         all_store_counts = []
         
         for store in stores:
             try:
-                doc_counts = file_search_client.list_documents(store.name)
-                display_name = getattr(store, "display_name", "Unknown")
+                # Listed stores already carry their counts; only a store given
+                # by name needs fetching
+                if store_name:
+                    doc_counts = file_search_client.list_documents(store.name)
+                else:
+                    doc_counts = file_search_client.get_document_counts(store)
+                display_name = getattr(store, "display_name", None) or "Unknown"
                 
-                all_store_counts.append({
+                item = {
                     "store_name": store.name,
                     "display_name": display_name,
                     "counts": doc_counts,
-                })
+                }
                     
             except Exception as e:
-                if json_output:
-                    all_store_counts.append({
+                if json_output or ndjson:
+                    item = {
                         "store_name": store.name,
                         "error": str(e)
-                    })
+                    }
                 else:
                     typer.echo(f"Error getting documents from {store.name}: {e}", err=True)
+                    continue
+            
+            # NDJSON streams each store as soon as it's counted
+            if ndjson:
+                _write_json(item, indent=False)
+            else:
+                all_store_counts.append(item)
+        
+        if ndjson:
+            return
         
         if json_output:
-            typer.echo(json.dumps(all_store_counts, indent=2))
+            _write_json(all_store_counts)
             return
         
         if not all_store_counts:
-            typer.echo("No stores found.")
+            emit("No stores found.")
             return
         
-        typer.echo("\nNote: The File Search API does not support listing individual documents.")
-        typer.echo("Showing document counts per store instead.\n")
+        emit("\nShowing document counts per store (use --documents to list them).\n")
         
         total_active = 0
         total_pending = 0
@@ -148,30 +238,30 @@ def list_docs(
         
         for item in all_store_counts:
             if "error" in item:
-                typer.echo(f"✗ {item['store_name']}")
-                typer.echo(f"  Error: {item['error']}\n")
+                emit(f"✗ {item['store_name']}")
+                emit(f"  Error: {item['error']}\n")
                 continue
             
             counts = item["counts"]
             display_name = item["display_name"]
             
-            typer.echo(f"Store: {item['store_name']} ({display_name})")
-            typer.echo("━" * 70)
+            emit(f"Store: {item['store_name']} ({display_name})")
+            emit("━" * 70)
             
             if counts["active"] > 0:
-                typer.echo(f"  ✓ Active (ready):  {counts['active']} document{'s' if counts['active'] != 1 else ''}")
+                emit(f"  ✓ Active (ready):  {counts['active']} document{'s' if counts['active'] != 1 else ''}")
             
             if counts["pending"] > 0:
-                typer.echo(f"  ⏳ Pending:        {counts['pending']} document{'s' if counts['pending'] != 1 else ''}")
+                emit(f"  ⏳ Pending:        {counts['pending']} document{'s' if counts['pending'] != 1 else ''}")
             
             if counts["failed"] > 0:
-                typer.echo(f"  ✗ Failed:         {counts['failed']} document{'s' if counts['failed'] != 1 else ''}")
+                emit(f"  ✗ Failed:         {counts['failed']} document{'s' if counts['failed'] != 1 else ''}")
             
             if counts["total"] == 0:
-                typer.echo("  (No documents)")
+                emit("  (No documents)")
             
-            typer.echo(f"  Total:           {counts['total']} document{'s' if counts['total'] != 1 else ''}")
-            typer.echo()
+            emit(f"  Total:           {counts['total']} document{'s' if counts['total'] != 1 else ''}")
+            emit("")
             
             total_active += counts["active"]
             total_pending += counts["pending"]
@@ -179,8 +269,8 @@ def list_docs(
         
         if len(all_store_counts) > 1:
             total = total_active + total_pending + total_failed
-            typer.echo(f"Summary: {total} total documents across {len(all_store_counts)} stores")
-            typer.echo(f"  ✓ {total_active} active, ⏳ {total_pending} pending, ✗ {total_failed} failed")
+            emit(f"Summary: {total} total documents across {len(all_store_counts)} stores")
+            emit(f"  ✓ {total_active} active, ⏳ {total_pending} pending, ✗ {total_failed} failed")
         
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
@@ -189,6 +279,87 @@ def list_docs(
     except Exception as e:
         typer.echo(f"Error listing documents: {e}", err=True)
         raise typer.Exit(1)
+    finally:
+        _flush(lines)
+
+
+def _document_record(store_name: str, doc: Any) -> dict[str, Any]:
+    """Build the JSON record for one document."""
+    return {
+        "store_name": store_name,
+        "name": doc.name,
+        "display_name": doc.display_name,
+        "state": getattr(doc.state, "value", doc.state),
+        "size_bytes": doc.size_bytes,
+        "mime_type": doc.mime_type,
+        "create_time": doc.create_time,
+    }
+
+
+def _list_store_documents(
+    stores: list[Any], emit: Callable[[str], None], json_output: bool, ndjson: bool
+) -> None:
+    """
+    Render the documents of each store as they are listed.
+    
+    Args:
+        stores: Stores to list
+        emit: Appends a line to the buffered text output
+        json_output: Write one indented JSON array of all documents
+        ndjson: Write one JSON object per document as it arrives
+    """
+    all_docs = []
+    
+    for store in stores:
+        display_name = getattr(store, "display_name", None) or "Unknown"
+        if not (json_output or ndjson):
+            emit(f"\nStore: {store.name} ({display_name})")
+            emit("━" * 70)
+        
+        count = 0
+        try:
+            for doc in file_search_client.iter_documents(store.name):
+                count += 1
+                if ndjson:
+                    _write_json(_document_record(store.name, doc), indent=False)
+                elif json_output:
+                    all_docs.append(_document_record(store.name, doc))
+                else:
+                    state = getattr(doc.state, "value", "")
+                    emit(f"  {_DOCUMENT_STATE_ICONS.get(state, '?')} {doc.display_name or doc.name}")
+                    emit(f"      {format_size(doc.size_bytes)}, created {format_timestamp(doc.create_time)}")
+        except Exception as e:
+            if json_output or ndjson:
+                record = {"store_name": store.name, "error": str(e)}
+                if ndjson:
+                    _write_json(record, indent=False)
+                else:
+                    all_docs.append(record)
+            else:
+                typer.echo(f"Error listing documents in {store.name}: {e}", err=True)
+            continue
+        
+        if not (json_output or ndjson):
+            emit(f"  Total: {count} document{'s' if count != 1 else ''}")
+    
+    if json_output and not ndjson:
+        _write_json(all_docs)
+
+
+def _check_store_health(store: Any) -> dict[str, Any]:
+    """Run a health check on one store, reporting failures as an error result."""
+    try:
+        health = file_search_client.health_check(store.name)
+        health["store_name"] = store.name
+        health["display_name"] = getattr(store, "display_name", None)
+        return health
+    except Exception as e:
+        return {
+            "store_name": store.name,
+            "display_name": getattr(store, "display_name", None),
+            "status": "error",
+            "error": str(e)
+        }
 
 
 @app.command("health-check")
@@ -196,15 +367,19 @@ def health_check(
     store_name: str = typer.Argument(None, help="File Search store name (checks default store if omitted)"),
     all_stores: bool = typer.Option(False, "--all", "-a", help="Check all stores"),
     json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Output one JSON object per line as results arrive"),
 ) -> None:
     """Check health of File Search stores."""
+    lines: list[str] = []
+    emit = lines.append
+    
     try:
         if store_name:
-            stores = [type("Store", (), {"name": store_name, "display_name": None})()]
+            stores = [_Store(name=store_name, display_name=None)]
         elif all_stores:
             stores = file_search_client.list_stores()
             if not stores:
-                typer.echo("No File Search stores found.")
+                emit("No File Search stores found.")
                 return
         else:
             all_stores_list = file_search_client.list_stores()
@@ -216,114 +391,99 @@ def health_check(
                     break
             
             if not stores:
-                typer.echo(f"Default store '{file_search_client.GLOBAL_STORE_NAME}' not found.")
-                typer.echo("Use --all to check all stores, or specify a store name.")
+                emit(f"Default store '{file_search_client.GLOBAL_STORE_NAME}' not found.")
+                emit("Use --all to check all stores, or specify a store name.")
                 raise typer.Exit(1)
         
-        all_results = []
-        
-        for store in stores:
-            try:
-                health = file_search_client.health_check(store.name)
-                health["store_name"] = store.name
-                health["display_name"] = getattr(store, "display_name", None)
-                all_results.append(health)
-            except Exception as e:
-                all_results.append({
-                    "store_name": store.name,
-                    "display_name": getattr(store, "display_name", None),
-                    "status": "error",
-                    "error": str(e)
-                })
+        # Checks are network-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(_HEALTH_CHECK_MAX_WORKERS, len(stores))) as executor:
+            if ndjson:
+                # NDJSON streams each result as soon as its check finishes
+                futures = [executor.submit(_check_store_health, store) for store in stores]
+                for future in as_completed(futures):
+                    _write_json(future.result(), indent=False)
+                return
+            
+            # map keeps results in store order for rendering
+            all_results = list(executor.map(_check_store_health, stores))
         
         if json_output:
-            typer.echo(json.dumps(all_results, indent=2))
+            _write_json(all_results)
             return
         
         if len(all_results) == 1:
             result = all_results[0]
             display_name = result.get("display_name") or "Unknown"
             
-            typer.echo(f"\nHealth Check: {result['store_name']} ({display_name})")
-            typer.echo("━" * 70)
-            typer.echo()
+            emit(f"\nHealth Check: {result['store_name']} ({display_name})")
+            emit("━" * 70)
+            emit("")
             
             if "error" in result:
-                typer.echo(f"✗ Error: {result['error']}")
+                emit(f"✗ Error: {result['error']}")
                 raise typer.Exit(1)
             
-            typer.echo(f"{'✓' if result['accessible'] else '✗'} Store accessible")
+            emit(f"{'✓' if result['accessible'] else '✗'} Store accessible")
             
             if result["document_count"] > 0:
-                typer.echo(f"✓ Documents loaded ({result['document_count']} documents)")
+                emit(f"✓ Documents loaded ({result['document_count']} documents)")
             else:
-                typer.echo("✗ No documents loaded")
+                emit("✗ No documents loaded")
             
-            typer.echo(f"{'✓' if result['all_processed'] else '✗'} All documents processed")
+            emit(f"{'✓' if result['all_processed'] else '✗'} All documents processed")
             
             if result["query_test_passed"]:
-                typer.echo("✓ Query test passed")
+                emit("✓ Query test passed")
             else:
-                typer.echo("✗ Query test failed")
+                emit("✗ Query test failed")
             
             if result["response_time"]:
                 if result["response_time"] < 5.0:
-                    typer.echo(f"✓ Response time OK ({result['response_time']:.2f}s)")
+                    emit(f"✓ Response time OK ({result['response_time']:.2f}s)")
                 else:
-                    typer.echo(f"⚠ Response time slow ({result['response_time']:.2f}s)")
+                    emit(f"⚠ Response time slow ({result['response_time']:.2f}s)")
             
-            typer.echo()
+            emit("")
             
             status = result["status"].upper()
             if status == "HEALTHY":
-                typer.echo("Overall Status: HEALTHY ✓")
+                emit("Overall Status: HEALTHY ✓")
             elif status == "WARNING":
-                typer.echo("Overall Status: WARNING ⚠")
+                emit("Overall Status: WARNING ⚠")
             else:
-                typer.echo("Overall Status: ERROR ✗")
+                emit("Overall Status: ERROR ✗")
             
             if result["issues"]:
-                typer.echo("\nIssues:")
+                emit("\nIssues:")
                 for issue in result["issues"]:
-                    typer.echo(f"  • {issue}")
+                    emit(f"  • {issue}")
             
             if status != "HEALTHY":
                 raise typer.Exit(1)
             
         else:
-            typer.echo("\nHealth Check: All Stores")
-            typer.echo("━" * 70)
-            typer.echo()
+            emit("\nHealth Check: All Stores")
+            emit("━" * 70)
+            emit("")
             
-            healthy_count = 0
+            healthy_count = sum(1 for result in all_results if result["status"].upper() == "HEALTHY")
             
             for result in all_results:
                 display_name = result.get("display_name") or "Unknown"
                 status = result["status"].upper()
+                if status not in _STATUS_ICONS:
+                    status = "ERROR"
                 
+                emit(f"{_STATUS_ICONS.get(status, '✗')} {result['store_name']} ({display_name})")
                 if "error" in result:
-                    typer.echo(f"✗ {result['store_name']} ({display_name})")
-                    typer.echo(f"  ERROR - {result['error']}")
-                elif status == "HEALTHY":
-                    typer.echo(f"✓ {result['store_name']} ({display_name})")
-                    typer.echo("  HEALTHY")
-                    healthy_count += 1
-                elif status == "WARNING":
-                    typer.echo(f"⚠ {result['store_name']} ({display_name})")
-                    typer.echo("  WARNING")
-                    if result["issues"]:
-                        for issue in result["issues"]:
-                            typer.echo(f"    • {issue}")
+                    emit(f"  ERROR - {result['error']}")
                 else:
-                    typer.echo(f"✗ {result['store_name']} ({display_name})")
-                    typer.echo("  ERROR")
-                    if result["issues"]:
-                        for issue in result["issues"]:
-                            typer.echo(f"    • {issue}")
-                
-                typer.echo()
+                    emit(f"  {status}")
+                    if status != "HEALTHY":
+                        lines.extend(f"    • {issue}" for issue in result["issues"])
+                emit("")
             
-            typer.echo(f"Summary: {healthy_count}/{len(all_results)} stores healthy")
+            emit(f"Summary: {healthy_count}/{len(all_results)} stores healthy")
             
             if healthy_count != len(all_results):
                 raise typer.Exit(1)
@@ -335,6 +495,8 @@ def health_check(
     except Exception as e:
         typer.echo(f"Error during health check: {e}", err=True)
         raise typer.Exit(1)
+    finally:
+        _flush(lines)
 
 
 @app.command("show-sources")
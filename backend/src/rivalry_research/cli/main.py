@@ -1,22 +1,51 @@
 """Main CLI entry point for Rivalry Research."""
 
+import importlib
+
+import click
 import typer
+from typer.core import TyperGroup
+
+# Subcommand groups: name -> (module in this package, help text). Modules are
+# imported only when their group runs, so e.g. `rivalry clean` doesn't load
+# the File Search client or the source fetchers.
+_SUBCOMMANDS = {
+    "clean": ("clean", "Data cleanup commands"),
+    "fs": ("fs", "File Search management commands"),
+    "sources": ("sources", "Source management commands"),
+    "images": ("images", "Image management commands"),
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Click group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return list(_SUBCOMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in _SUBCOMMANDS:
+            return None
+        module_name, help_text = _SUBCOMMANDS[cmd_name]
+        module = importlib.import_module(f".{module_name}", __package__)
+        command = typer.main.get_group(module.app)
+        command.name = cmd_name
+        command.help = help_text
+        return command
 
-from . import clean, fs, sources, images
 
 app = typer.Typer(
     name="rivalry",
     help="Rivalry Research CLI - Tools for analyzing rivalrous relationships",
     no_args_is_help=True,
+    cls=_LazyGroup,
 )
 
-# Register subcommand groups
-app.add_typer(clean.app, name="clean", help="Data cleanup commands")
-app.add_typer(fs.app, name="fs", help="File Search management commands")
-app.add_typer(sources.app, name="sources", help="Source management commands")
-app.add_typer(images.app, name="images", help="Image management commands")
+
+@app.callback()
+def main() -> None:
+    """Rivalry Research CLI - Tools for analyzing rivalrous relationships."""
 
 
 if __name__ == "__main__":
     app()
-
@@ -14,7 +14,7 @@ from ..sources import (
     process_existing_sources,
     scan_raw_sources_directory,
     get_source_statistics,
-    validate_manual_source,
+    validate_sources_parallel,
 )
 from ..storage import SourceDatabase
 
@@ -102,12 +102,12 @@ def scan(
         table.add_column("Has Content", style="green")
         
         for source_meta in result.sources_not_in_db[:20]:
-            source_dir = Path(source_meta["source_dir"])
+            source_dir = Path(source_meta.source_dir)
             table.add_row(
-                source_meta.get("entity_id", "?"),
+                source_meta.entity_id or "?",
                 source_dir.name,
-                source_meta.get("file_type", "?"),
-                "✓" if source_meta.get("has_content_txt") else "✗",
+                source_meta.file_type,
+                "✓" if source_meta.has_content_txt else "✗",
             )
         
         console.print(table)
@@ -294,26 +294,26 @@ def validate(
     if entity:
         entity_dirs = [d for d in entity_dirs if entity in d.name]
     
-    total_validated = 0
+    manual_dirs = [
+        manual_dir
+        for entity_dir in entity_dirs
+        for manual_dir in entity_dir.iterdir()
+        if manual_dir.is_dir() and manual_dir.name.startswith("manual_")
+    ]
+    
+    total_validated = len(manual_dirs)
     total_valid = 0
     total_invalid = 0
     
-    for entity_dir in entity_dirs:
-        manual_dirs = [
-            d for d in entity_dir.iterdir() 
-            if d.is_dir() and d.name.startswith("manual_")
-        ]
-        
-        for manual_dir in manual_dirs:
-            total_validated += 1
-            is_valid, message = validate_manual_source(manual_dir)
-            
-            if is_valid:
-                total_valid += 1
-                console.print(f"[green]✓ {entity_dir.name}/{manual_dir.name}: {message}[/green]")
-            else:
-                total_invalid += 1
-                console.print(f"[red]✗ {entity_dir.name}/{manual_dir.name}: {message}[/red]")
+    # PDF validation is CPU-bound, so validate in parallel processes
+    for manual_dir, is_valid, message in validate_sources_parallel(manual_dirs):
+        label = f"{manual_dir.parent.name}/{manual_dir.name}"
+        if is_valid:
+            total_valid += 1
+            console.print(f"[green]✓ {label}: {message}[/green]")
+        else:
+            total_invalid += 1
+            console.print(f"[red]✗ {label}: {message}[/red]")
     
     console.print(f"\n[bold]Validation Summary:[/bold]")
     console.print(f"  Total validated: {total_validated}")
@@ -1,12 +1,38 @@
 """Wikidata API client for SPARQL and REST API interactions."""
 
+import atexit
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import operator
+import os
+import threading
 import time
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
+from pydantic import ValidationError
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; without it SPARQL results are parsed in one piece
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from .config import get_settings
 from .models import EntitySearchResult, WikidataEntity
 
+logger = logging.getLogger(__name__)
+
 # API endpoints
 SPARQL_ENDPOINT = "https://query.wikidata.org/sparql"
 MEDIAWIKI_API = "https://www.wikidata.org/w/api.php"
@@ -15,25 +41,102 @@ ENTITY_DATA_URL = "https://www.wikidata.org/wiki/Special:EntityData/{entity_id}.
 # User agent for Wikidata compliance
 USER_AGENT = "RivalryResearch/0.1.0 (https://github.com/user/rivalry-research)"
 
-# Rate limiting
-_last_request_time = 0.0
-_min_request_interval = 0.1  # 100ms between requests
+# Rate limiting: sustained requests per second, with short bursts allowed
+_requests_per_second = 10.0
+_request_burst = 5
+
+# Number of searches memoized by search_entities, and how long (in seconds)
+# a memoized result is reused
+_SEARCH_CACHE_SIZE = 1024
+_SEARCH_CACHE_TTL = 3600.0
+
+# wbgetentities accepts at most 50 IDs per request
+_MAX_ENTITIES_PER_REQUEST = 50
+
+# Directory under data_dir for cached SPARQL results
+_SPARQL_CACHE_DIR = "sparql_cache"
+
+# Per-statement keys dropped from entity claims; nothing here reads them and
+# references are often most of a statement's size
+_DROPPED_CLAIM_KEYS = ("references",)
+
+# Shared helpers for parsing entity JSON
+_EMPTY: dict[str, Any] = {}
+_VALUE_GETTER = operator.itemgetter("value")
+
+# Shared HTTP client so connections to Wikidata are kept alive between requests
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared Wikidata HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    headers={"User-Agent": USER_AGENT},
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                )
+                atexit.register(_client.close)
+    return _client
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Tokens refill at `rate` per second up to `burst`. Thread-safe: each caller
+    takes a token under the lock (going into debt if none are left) and sleeps
+    outside it, so concurrent requests run in parallel up to the burst size
+    and are spaced at the sustained rate beyond it.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "last_refill", "lock")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request is allowed."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+
+_WIKIDATA_LIMITER = _TokenBucket(_requests_per_second, _request_burst)
 
 
 def _rate_limit() -> None:
     """Enforce rate limiting between requests."""
-    global _last_request_time
-    now = time.time()
-    time_since_last = now - _last_request_time
-    if time_since_last < _min_request_interval:
-        time.sleep(_min_request_interval - time_since_last)
-    _last_request_time = time.time()
+    _WIKIDATA_LIMITER.acquire()
 
 
 def execute_sparql_query(query: str, timeout: float = 30.0) -> list[dict[str, Any]]:
     """
     Execute a SPARQL query against Wikidata Query Service.
 
+    Results are cached on disk under data_dir/sparql_cache for
+    sparql_cache_ttl seconds (see Settings), so repeated runs don't
+    re-issue identical queries.
+
     Args:
         query: SPARQL query string
         timeout: Request timeout in seconds
@@ -41,28 +144,145 @@ def execute_sparql_query(query: str, timeout: float = 30.0) -> list[dict[str, An
     Returns:
         List of result bindings as dictionaries
 
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response format is invalid
+    """
+    cache_file = _sparql_cache_file(query)
+    if cache_file is not None:
+        bindings = _read_sparql_cache(cache_file)
+        if bindings is not None:
+            return bindings
+
+    bindings = list(iter_sparql_query(query, timeout=timeout))
+
+    if cache_file is not None:
+        _write_sparql_cache(cache_file, bindings)
+    return bindings
+
+
+def _sparql_cache_file(query: str) -> str | None:
+    """
+    Get the cache file path for a SPARQL query.
+
+    Returns:
+        Path of the gzipped JSON cache file, or None if caching is disabled
+        (or settings can't be loaded, e.g. GOOGLE_API_KEY is not set)
+    """
+    try:
+        settings = get_settings()
+    except ValidationError:
+        return None
+    if not settings.sparql_cache_enabled:
+        return None
+
+    key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(settings.data_dir, _SPARQL_CACHE_DIR, key + ".json.gz")
+
+
+def _read_sparql_cache(cache_file: str) -> list[dict[str, Any]] | None:
+    """Read cached bindings if present and younger than the cache TTL."""
+    try:
+        if os.stat(cache_file).st_mtime < time.time() - get_settings().sparql_cache_ttl:
+            return None
+        with open(cache_file, "rb") as f:
+            return _parse_json(gzip.decompress(f.read()))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable SPARQL cache file {cache_file}: {e}")
+        return None
+
+
+def _write_sparql_cache(cache_file: str, bindings: list[dict[str, Any]]) -> None:
+    """Write bindings to the cache atomically; failures only log a warning."""
+    if orjson is not None:
+        payload = orjson.dumps(bindings)
+    else:
+        payload = json.dumps(bindings).encode("utf-8")
+
+    tmp_file = cache_file + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            f.write(gzip.compress(payload))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write SPARQL cache file {cache_file}: {e}")
+
+
+def iter_sparql_query(query: str, timeout: float = 30.0) -> Iterator[dict[str, Any]]:
+    """
+    Execute a SPARQL query and yield result bindings as they arrive.
+
+    With ijson installed the response is parsed incrementally, so large
+    result sets are never held in memory at once; otherwise the whole
+    response is parsed before the first binding is yielded.
+
+    Args:
+        query: SPARQL query string
+        timeout: Request timeout in seconds
+
+    Yields:
+        Result bindings as dictionaries
+
     Raises:
         httpx.HTTPError: If the request fails
         ValueError: If the response format is invalid
     """
     _rate_limit()
 
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "application/sparql-results+json",
-    }
+    headers = {"Accept": "application/sparql-results+json"}
 
     params = {"query": query, "format": "json"}
 
-    with httpx.Client(timeout=timeout) as client:
-        response = client.get(SPARQL_ENDPOINT, headers=headers, params=params)
+    with _get_client().stream(
+        "GET", SPARQL_ENDPOINT, headers=headers, params=params, timeout=timeout
+    ) as response:
         response.raise_for_status()
 
-        data = response.json()
-        if "results" not in data or "bindings" not in data["results"]:
-            raise ValueError("Invalid SPARQL response format")
+        if ijson is None:
+            yield from _sparql_bindings(_parse_json(response.read()))
+            return
+
+        bindings = ijson.sendable_list()
+        parser = ijson.items_coro(bindings, "results.bindings.item")
+        # An empty result and a response without results.bindings both
+        # produce no items, so keep the raw bytes until the first binding
+        # arrives; if none does, the (small) response is checked in full
+        received: list[bytes] | None = []
+        try:
+            for chunk in response.iter_bytes():
+                if received is not None:
+                    received.append(chunk)
+                parser.send(chunk)
+                if bindings:
+                    received = None
+                    yield from bindings
+                    del bindings[:]
+            parser.close()
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid SPARQL response format: {e}") from e
+        if bindings:
+            yield from bindings
+        elif received is not None:
+            yield from _sparql_bindings(_parse_json(b"".join(received)))
+
+
+def _sparql_bindings(data: Any) -> list[dict[str, Any]]:
+    """
+    Get the result bindings from a parsed SPARQL JSON response.
 
-        return data["results"]["bindings"]
+    Raises:
+        ValueError: If the response has no results.bindings
+    """
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("results"), dict)
+        or "bindings" not in data["results"]
+    ):
+        raise ValueError("Invalid SPARQL response format")
+    return data["results"]["bindings"]
 
 
 def search_entities(
@@ -75,6 +295,10 @@ def search_entities(
     """
     Search for Wikidata entities by name.
 
+    Results are memoized for up to an hour, so repeated searches during
+    disambiguation don't hit the API again; each call returns copies, so
+    callers may modify them freely.
+
     Args:
         search_term: The search query (e.g., person's name)
         entity_type: Optional filter by entity type (e.g., "Q5" for humans)
@@ -88,9 +312,25 @@ def search_entities(
     Raises:
         httpx.HTTPError: If the request fails
     """
-    _rate_limit()
+    # The TTL bucket is part of the cache key, so entries expire when it rolls over
+    ttl_bucket = int(time.monotonic() // _SEARCH_CACHE_TTL)
+    results = _search_entities_cached(
+        search_term, entity_type, language, limit, timeout, ttl_bucket
+    )
+    return [result.model_copy() for result in results]
 
-    headers = {"User-Agent": USER_AGENT}
+
+@functools.lru_cache(maxsize=_SEARCH_CACHE_SIZE)
+def _search_entities_cached(
+    search_term: str,
+    entity_type: str | None,
+    language: str,
+    limit: int,
+    timeout: float,
+    ttl_bucket: int,
+) -> tuple[EntitySearchResult, ...]:
+    """Run a wbsearchentities query; failures are not cached."""
+    _rate_limit()
 
     params: dict[str, Any] = {
         "action": "wbsearchentities",
@@ -103,26 +343,28 @@ def search_entities(
     if entity_type:
         params["type"] = "item"
 
-    with httpx.Client(timeout=timeout) as client:
-        response = client.get(MEDIAWIKI_API, headers=headers, params=params)
-        response.raise_for_status()
+    response = _get_client().get(MEDIAWIKI_API, params=params, timeout=timeout)
+    response.raise_for_status()
+
+    data = _parse_json(response.content)
 
-        data = response.json()
+    if "search" not in data:
+        return ()
 
-        if "search" not in data:
-            return []
+    results = []
+    for item in data["search"]:
+        result = EntitySearchResult(
+            id=item["id"],
+            label=item.get("label", ""),
+            description=item.get("description"),
+            match_score=item.get("match", {}).get("score") if "match" in item else None,
+        )
+        results.append(result)
+
+    return tuple(results)
 
-        results = []
-        for item in data["search"]:
-            result = EntitySearchResult(
-                id=item["id"],
-                label=item.get("label", ""),
-                description=item.get("description"),
-                match_score=item.get("match", {}).get("score") if "match" in item else None,
-            )
-            results.append(result)
 
-        return results
+search_entities.cache_clear = _search_entities_cached.cache_clear
 
 
 def get_entity(entity_id: str, timeout: float = 10.0) -> WikidataEntity:
@@ -140,65 +382,104 @@ def get_entity(entity_id: str, timeout: float = 10.0) -> WikidataEntity:
         httpx.HTTPError: If the request fails
         ValueError: If entity not found or invalid response
     """
-    _rate_limit()
+    return get_entities([entity_id], timeout=timeout)[entity_id]
 
-    headers = {"User-Agent": USER_AGENT}
 
-    params = {
-        "action": "wbgetentities",
-        "ids": entity_id,
-        "format": "json",
-        "languages": "en",
-    }
+def get_entities(
+    entity_ids: list[str], timeout: float = 10.0
+) -> dict[str, WikidataEntity]:
+    """
+    Fetch full entity data for several Wikidata entities.
 
-    with httpx.Client(timeout=timeout) as client:
-        response = client.get(MEDIAWIKI_API, headers=headers, params=params)
+    IDs are requested in batches of up to 50 (the wbgetentities limit),
+    one rate-limited request per batch.
+
+    Args:
+        entity_ids: Wikidata entity IDs (e.g., ["Q42", "Q1035"])
+        timeout: Request timeout in seconds
+
+    Returns:
+        Dictionary mapping each entity ID to its WikidataEntity
+
+    Raises:
+        httpx.HTTPError: If a request fails
+        ValueError: If any entity is not found or the response is invalid
+    """
+    entities: dict[str, WikidataEntity] = {}
+    unique_ids = list(dict.fromkeys(entity_ids))
+
+    for start in range(0, len(unique_ids), _MAX_ENTITIES_PER_REQUEST):
+        chunk = unique_ids[start:start + _MAX_ENTITIES_PER_REQUEST]
+
+        _rate_limit()
+
+        params = {
+            "action": "wbgetentities",
+            "ids": "|".join(chunk),
+            "format": "json",
+            "languages": "en",
+        }
+
+        response = _get_client().get(MEDIAWIKI_API, params=params, timeout=timeout)
         response.raise_for_status()
 
-        data = response.json()
-
-        if "entities" not in data or entity_id not in data["entities"]:
-            raise ValueError(f"Entity {entity_id} not found")
-
-        entity_data = data["entities"][entity_id]
-
-        if "missing" in entity_data:
-            raise ValueError(f"Entity {entity_id} does not exist")
-
-        # Extract label
-        label = ""
-        if "labels" in entity_data and "en" in entity_data["labels"]:
-            label = entity_data["labels"]["en"]["value"]
-
-        # Extract description
-        description = None
-        if "descriptions" in entity_data and "en" in entity_data["descriptions"]:
-            description = entity_data["descriptions"]["en"]["value"]
-
-        # Extract aliases
-        aliases = []
-        if "aliases" in entity_data and "en" in entity_data["aliases"]:
-            aliases = [alias["value"] for alias in entity_data["aliases"]["en"]]
-
-        # Get all claims
-        claims = entity_data.get("claims", {})
-        
-        # Extract sitelinks (links to Wikipedia and other Wikimedia projects)
-        sitelinks = entity_data.get("sitelinks", {})
-        
-        # Extract English Wikipedia URL
-        wikipedia_url = None
-        if "enwiki" in sitelinks:
-            wiki_title = sitelinks["enwiki"]["title"]
-            # URL-encode the title by replacing spaces with underscores
-            wikipedia_url = f"https://en.wikipedia.org/wiki/{wiki_title.replace(' ', '_')}"
-        
-        return WikidataEntity(
-            id=entity_id,
-            label=label,
-            description=description,
-            aliases=aliases,
-            claims=claims,
-            sitelinks=sitelinks,
-            wikipedia_url=wikipedia_url,
-        )
+        data = _parse_json(response.content)
+        entities_data = data.get("entities", {})
+
+        for entity_id in chunk:
+            if entity_id not in entities_data:
+                raise ValueError(f"Entity {entity_id} not found")
+            entities[entity_id] = _parse_entity(entity_id, entities_data[entity_id])
+
+    return entities
+
+
+def _parse_entity(entity_id: str, entity_data: dict[str, Any]) -> WikidataEntity:
+    """
+    Build a WikidataEntity from one entry of a wbgetentities response.
+
+    Args:
+        entity_id: Wikidata entity ID
+        entity_data: The entity's JSON object from the response
+
+    Returns:
+        WikidataEntity with full entity data
+
+    Raises:
+        ValueError: If the entity does not exist
+    """
+    if "missing" in entity_data:
+        raise ValueError(f"Entity {entity_id} does not exist")
+
+    # Extract English label, description and aliases (one lookup per level)
+    label = entity_data.get("labels", _EMPTY).get("en", _EMPTY).get("value", "")
+    description = entity_data.get("descriptions", _EMPTY).get("en", _EMPTY).get("value")
+    aliases = list(map(_VALUE_GETTER, entity_data.get("aliases", _EMPTY).get("en", ())))
+
+    # Get all claims, minus the statement parts we never use. The response
+    # was parsed just for us, so trim it in place rather than copying.
+    claims = entity_data.get("claims", {})
+    for statements in claims.values():
+        for statement in statements:
+            for key in _DROPPED_CLAIM_KEYS:
+                statement.pop(key, None)
+    
+    # Extract sitelinks (links to Wikipedia and other Wikimedia projects)
+    sitelinks = entity_data.get("sitelinks", {})
+    
+    # Extract English Wikipedia URL
+    wikipedia_url = None
+    if "enwiki" in sitelinks:
+        wiki_title = sitelinks["enwiki"]["title"]
+        # URL-encode the title by replacing spaces with underscores
+        wikipedia_url = f"https://en.wikipedia.org/wiki/{wiki_title.replace(' ', '_')}"
+    
+    return WikidataEntity(
+        id=entity_id,
+        label=label,
+        description=description,
+        aliases=aliases,
+        claims=claims,
+        sitelinks=sitelinks,
+        wikipedia_url=wikipedia_url,
+    )
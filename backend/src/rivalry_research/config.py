@@ -21,6 +21,13 @@ class Settings(BaseSettings):
     raw_sources_dir: Path = Path("data/raw_sources")
     analyses_dir: Path = Path("data/analyses")
 
+    # Saved analyses younger than this are reused instead of re-running
+    analysis_max_age_days: float = 7.0
+
+    # On-disk cache of Wikidata SPARQL results (under data_dir/sparql_cache)
+    sparql_cache_enabled: bool = True
+    sparql_cache_ttl: float = 86400.0  # seconds
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
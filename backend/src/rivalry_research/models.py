@@ -1,12 +1,36 @@
 """Pydantic models for Wikidata entities, relationships, and rivalry analysis."""
 
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, field_serializer
 
 
-class EntitySearchResult(BaseModel):
+class _Model(BaseModel):
+    """Base class for the models in this module."""
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """
+        Build an instance without running validation.
+
+        Only for data that is already known to be valid: rows written from
+        validated models, or values computed in-process from typed objects.
+        Nested models must already be model instances (nothing is parsed),
+        and untrusted input such as LLM output or HTTP responses must go
+        through normal construction instead.
+
+        Args:
+            **data: Field values; omitted fields get their defaults
+
+        Returns:
+            Model instance
+        """
+        return cls.model_construct(**data)
+
+
+class EntitySearchResult(_Model):
     """Search result for entity disambiguation."""
 
     id: str = Field(..., description="Wikidata entity ID (e.g., 'Q42')")
@@ -17,7 +41,7 @@ class EntitySearchResult(BaseModel):
     )
 
 
-class WikidataEntity(BaseModel):
+class WikidataEntity(_Model):
     """Full Wikidata entity with all properties."""
 
     id: str = Field(..., description="Wikidata entity ID (e.g., 'Q42')")
@@ -25,7 +49,8 @@ class WikidataEntity(BaseModel):
     description: str | None = Field(None, description="Entity description")
     aliases: list[str] = Field(default_factory=list, description="Alternative names")
     claims: dict[str, Any] = Field(
-        default_factory=dict, description="All claims/statements for this entity"
+        default_factory=dict,
+        description="All claims/statements for this entity (without references)",
     )
     sitelinks: dict[str, Any] = Field(
         default_factory=dict, description="Links to pages in various Wikimedia projects"
@@ -35,7 +60,7 @@ class WikidataEntity(BaseModel):
     )
 
 
-class Relationship(BaseModel):
+class Relationship(_Model):
     """Relationship between two Wikidata entities."""
 
     source_entity_id: str = Field(..., description="Source entity ID (subject)")
@@ -56,7 +81,7 @@ class Relationship(BaseModel):
     )
 
 
-class EntityImage(BaseModel):
+class EntityImage(_Model):
     """Image for an entity from various public domain sources."""
 
     url: str = Field(..., description="Full resolution image URL")
@@ -76,7 +101,7 @@ class EntityImage(BaseModel):
     )
 
 
-class RivalryEntity(BaseModel):
+class RivalryEntity(_Model):
     """Entity involved in a rivalry with biographical context."""
 
     id: str = Field(..., description="Wikidata entity ID (e.g., 'Q42')")
@@ -93,7 +118,7 @@ class RivalryEntity(BaseModel):
     )
 
 
-class RivalryFact(BaseModel):
+class RivalryFact(_Model):
     """Individual fact about a rivalry or conflict."""
 
     fact: str = Field(..., description="The rivalry fact or incident")
@@ -112,7 +137,7 @@ class RivalryFact(BaseModel):
     )
 
 
-class Source(BaseModel):
+class Source(_Model):
     """Full metadata for a source document with credibility scoring."""
 
     source_id: str = Field(..., description="Unique source identifier (e.g., 'src_001')")
@@ -158,7 +183,7 @@ class Source(BaseModel):
     )
 
 
-class EventSource(BaseModel):
+class EventSource(_Model):
     """Reference to a source for a specific timeline event."""
 
     source_id: str = Field(
@@ -173,7 +198,57 @@ class EventSource(BaseModel):
     )
 
 
-class SourcesSummary(BaseModel):
+class TimelineEvent(_Model):
+    """Individual event in a rivalry timeline."""
+
+    date: str = Field(
+        ..., description="Date or time period (e.g., '1665', '1684-11-05', 'late 1600s')"
+    )
+    event_type: str = Field(
+        ...,
+        description="Type of event (achievement, conflict, publication, meeting, debate, etc.)",
+    )
+    description: str = Field(
+        ...,
+        description="Detailed description of the event including setting, context, interactions, responses, and impact. REQUIRED: Include inline source citations using {source_id} markers (e.g., 'Koch challenged Pasteur{wiki_abc123}') when sources are available."
+    )
+    entity_id: str = Field(
+        ...,
+        description="Entity this event relates to (entity ID or 'both' for shared events)",
+    )
+    rivalry_relevance: str = Field(
+        default="direct",
+        description="Relevance to rivalry: 'direct' (head-to-head conflict), 'parallel' (competing work), 'context' (establishing overlap), 'resolution' (ending/recognition)",
+    )
+    direct_quotes: list[str] = Field(
+        default_factory=list,
+        description="Verbatim quotes from participants with attribution (e.g., 'Koch: \"The methods are unreliable\"'). Capture insults, criticisms, or notable statements.",
+    )
+    sources: list[EventSource] = Field(
+        default_factory=list,
+        description="REQUIRED: Array of EventSource objects with source_id, supporting_text, and page_reference. Must be populated even when inline {source_id} markers are included in description.",
+    )
+    source_count: int = Field(
+        default=0, description="Number of sources supporting this event"
+    )
+    confidence: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Confidence in this event based on source quality and agreement",
+    )
+    has_multiple_sources: bool = Field(
+        default=False, description="Whether event is corroborated by multiple sources"
+    )
+    has_primary_source: bool = Field(
+        default=False, description="Whether event has at least one primary source"
+    )
+    validation_notes: str | None = Field(
+        None, description="Any caveats or notes about source validation"
+    )
+
+
+class SourcesSummary(_Model):
     """Summary statistics about sources used in an analysis."""
 
     total_sources: int = Field(..., description="Total number of sources")
@@ -194,7 +269,7 @@ class SourcesSummary(BaseModel):
     )
 
 
-class RivalryAnalysis(BaseModel):
+class RivalryAnalysis(_Model):
     """Complete analysis of rivalry between two entities."""
 
     entity1: RivalryEntity = Field(..., description="First entity with biographical data")
@@ -215,7 +290,7 @@ class RivalryAnalysis(BaseModel):
         None, description="When the rivalry ended or was resolved (YYYY format)"
     )
     summary: str = Field(..., description="Natural language summary of the rivalry")
-    timeline: list["TimelineEvent"] = Field(
+    timeline: list[TimelineEvent] = Field(
         default_factory=list,
         description="Chronological timeline of rivalry-relevant events only (not full biographies)",
     )
@@ -238,8 +313,19 @@ class RivalryAnalysis(BaseModel):
         default_factory=datetime.now, description="Timestamp of analysis"
     )
 
+    @field_serializer("sources", mode="wrap")
+    def _serialize_sources(
+        self, sources: Mapping[str, Source], handler: SerializerFunctionWrapHandler
+    ):
+        # Storage may attach a lazily loaded mapping (LazySourceMap); serialize
+        # its contents as a plain dict. No return annotation: pydantic would
+        # take it as the output type and lose Source from the JSON schema
+        if not isinstance(sources, dict):
+            sources = dict(sources)
+        return handler(sources)
+
 
-class Citation(BaseModel):
+class Citation(_Model):
     """Citation from RAG grounding metadata."""
 
     text: str = Field(..., description="The cited passage from the source")
@@ -259,57 +345,7 @@ class Citation(BaseModel):
     )
 
 
-class TimelineEvent(BaseModel):
-    """Individual event in a rivalry timeline."""
-
-    date: str = Field(
-        ..., description="Date or time period (e.g., '1665', '1684-11-05', 'late 1600s')"
-    )
-    event_type: str = Field(
-        ...,
-        description="Type of event (achievement, conflict, publication, meeting, debate, etc.)",
-    )
-    description: str = Field(
-        ...,
-        description="Detailed description of the event including setting, context, interactions, responses, and impact. REQUIRED: Include inline source citations using {source_id} markers (e.g., 'Koch challenged Pasteur{wiki_abc123}') when sources are available."
-    )
-    entity_id: str = Field(
-        ...,
-        description="Entity this event relates to (entity ID or 'both' for shared events)",
-    )
-    rivalry_relevance: str = Field(
-        default="direct",
-        description="Relevance to rivalry: 'direct' (head-to-head conflict), 'parallel' (competing work), 'context' (establishing overlap), 'resolution' (ending/recognition)",
-    )
-    direct_quotes: list[str] = Field(
-        default_factory=list,
-        description="Verbatim quotes from participants with attribution (e.g., 'Koch: \"The methods are unreliable\"'). Capture insults, criticisms, or notable statements.",
-    )
-    sources: list[EventSource] = Field(
-        default_factory=list,
-        description="REQUIRED: Array of EventSource objects with source_id, supporting_text, and page_reference. Must be populated even when inline {source_id} markers are included in description.",
-    )
-    source_count: int = Field(
-        default=0, description="Number of sources supporting this event"
-    )
-    confidence: float = Field(
-        default=1.0,
-        ge=0.0,
-        le=1.0,
-        description="Confidence in this event based on source quality and agreement",
-    )
-    has_multiple_sources: bool = Field(
-        default=False, description="Whether event is corroborated by multiple sources"
-    )
-    has_primary_source: bool = Field(
-        default=False, description="Whether event has at least one primary source"
-    )
-    validation_notes: str | None = Field(
-        None, description="Any caveats or notes about source validation"
-    )
-
-
-class TimelineAnalysis(BaseModel):
+class TimelineAnalysis(_Model):
     """Timeline analysis for a rivalry pair."""
 
     entity1_id: str = Field(..., description="First entity ID")
@@ -327,7 +363,7 @@ class TimelineAnalysis(BaseModel):
     latest_event: str | None = Field(None, description="Date of latest event in timeline")
 
 
-class SourceDocument(BaseModel):
+class SourceDocument(_Model):
     """Metadata about an uploaded source document."""
 
     entity_id: str = Field(..., description="Entity this document is about")
@@ -2,6 +2,8 @@
 
 import logging
 import time
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,9 @@ GLOBAL_STORE_NAME = "rivalry_research_sources"
 # Default model for RAG queries
 DEFAULT_RAG_MODEL = "gemini-2.5-flash"
 
+# Largest page the File Search list endpoints return
+MAX_PAGE_SIZE = 20
+
 
 def _get_client() -> genai.Client:
     """
@@ -108,8 +113,8 @@ def upload_document(
         ... }
         >>> upload_document(store.name, "Isaac Newton", content, custom_metadata=metadata)
     """
-    logger.debug(f"Uploading document: {display_name}")
-    logger.debug(f"Content size: {len(content)} characters")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Uploading document: %s (%d characters)", display_name, len(content))
     
     client = _get_client()
     
@@ -124,13 +129,13 @@ def upload_document(
             # Determine if value should be string or numeric
             metadata_list.append({"key": key, "string_value": str(value)})
         config["custom_metadata"] = metadata_list
-        logger.debug(f"Including {len(metadata_list)} metadata fields")
+        logger.debug("Including %d metadata fields", len(metadata_list))
     
     # Add chunking config if explicitly provided
     # Otherwise, let the API use its own defaults
     if chunking_config:
         config["chunking_config"] = chunking_config
-        logger.debug(f"Using custom chunking config: {chunking_config}")
+        logger.debug("Using custom chunking config: %s", chunking_config)
     
     # Create a temporary file with the content
     # Use a sanitized version of display name for temp file
@@ -140,7 +145,7 @@ def upload_document(
         temp_file.write_text(content, encoding="utf-8")
         
         # Upload and import the file
-        logger.debug(f"Starting upload to store: {store_name}")
+        logger.debug("Starting upload to store: %s", store_name)
         operation = client.file_search_stores.upload_to_file_search_store(
             file=str(temp_file),
             file_search_store_name=store_name,
@@ -152,21 +157,21 @@ def upload_document(
         start_time = time.time()
         while not operation.done:
             if time.time() - start_time > timeout:
-                logger.error(f"Document import timed out after {timeout} seconds")
+                logger.error("Document import timed out after %s seconds", timeout)
                 raise TimeoutError(
                     f"Document import timed out after {timeout} seconds"
                 )
             time.sleep(5)
             operation = client.operations.get(operation)
         
-        logger.info(f"Document uploaded successfully: {display_name}")
+        logger.info("Document uploaded successfully: %s", display_name)
         return operation
         
     finally:
         # Clean up temp file
         if temp_file.exists():
             temp_file.unlink()
-            logger.debug(f"Cleaned up temporary file: {temp_file}")
+            logger.debug("Cleaned up temporary file: %s", temp_file)
 
 
 def check_document_exists(store_name: str, entity_id: str) -> bool:
@@ -380,10 +385,14 @@ def delete_store(store_name: str) -> None:
         raise Exception(f"Failed to delete store: {e}") from e
 
 
-def list_stores() -> list[Any]:
+def list_stores(limit: int | None = None) -> list[Any]:
     """
     List all File Search stores in the project.
     
+    Args:
+        limit: Maximum number of stores to return (all if None). Pages are
+            requested no larger than needed and paging stops once reached.
+    
     Returns:
         List of FileSearchStore objects with name, display_name, metadata
     
@@ -396,11 +405,10 @@ def list_stores() -> list[Any]:
         ...     print(f"{store.name}: {store.display_name}")
     """
     client = _get_client()
+    config = {"page_size": min(limit, MAX_PAGE_SIZE)} if limit else None
     
     try:
-        stores = []
-        for store in client.file_search_stores.list():
-            stores.append(store)
+        stores = list(islice(client.file_search_stores.list(config=config), limit))
         logger.debug(f"Found {len(stores)} File Search stores")
         return stores
     except Exception as e:
@@ -411,8 +419,8 @@ def list_documents(store_name: str) -> dict[str, Any]:
     """
     Get document counts for a File Search store.
     
-    Note: The File Search API does not support listing individual documents.
-    This function returns document counts from the store metadata instead.
+    Counts come from the store metadata; use iter_documents() to list the
+    individual documents.
     
     Args:
         store_name: File Search store name (e.g., 'fileSearchStores/abc123')
@@ -435,23 +443,70 @@ def list_documents(store_name: str) -> dict[str, Any]:
     
     try:
         store = client.file_search_stores.get(name=store_name)
-        
-        # Extract document counts from store metadata
-        active = int(getattr(store, 'active_documents_count', 0) or 0)
-        pending = int(getattr(store, 'pending_documents_count', 0) or 0)
-        failed = int(getattr(store, 'failed_documents_count', 0) or 0)
-        
-        counts = {
-            'active': active,
-            'pending': pending,
-            'failed': failed,
-            'total': active + pending + failed,
-        }
-        
-        logger.debug(f"Document counts for {store_name}: {counts}")
-        return counts
     except Exception as e:
         raise Exception(f"Failed to get document counts: {e}") from e
+    
+    return get_document_counts(store)
+
+
+def iter_documents(store_name: str, limit: int | None = None) -> Iterator[Any]:
+    """
+    Iterate over the documents in a File Search store.
+    
+    Documents are yielded as each page arrives, so callers can start
+    rendering before the whole store has been listed.
+    
+    Args:
+        store_name: File Search store name (e.g., 'fileSearchStores/abc123')
+        limit: Maximum number of documents to yield (all if None). Pages are
+            requested no larger than needed and paging stops once reached.
+    
+    Yields:
+        Document objects with name, display_name, state, size_bytes, etc.
+    
+    Raises:
+        Exception: If listing fails
+    
+    Example:
+        >>> for doc in iter_documents("fileSearchStores/abc123", limit=10):
+        ...     print(doc.display_name, doc.state)
+    """
+    client = _get_client()
+    config = {"page_size": min(limit, MAX_PAGE_SIZE)} if limit else None
+    
+    try:
+        pager = client.file_search_stores.documents.list(parent=store_name, config=config)
+        yield from islice(pager, limit)
+    except Exception as e:
+        raise Exception(f"Failed to list documents: {e}") from e
+
+
+def get_document_counts(store: Any) -> dict[str, int]:
+    """
+    Get document counts from an already fetched File Search store.
+    
+    Stores returned by list_stores() already carry their counts, so this
+    avoids fetching each store again.
+    
+    Args:
+        store: FileSearchStore object
+    
+    Returns:
+        Dict with active, pending, failed and total document counts
+    """
+    active = int(getattr(store, 'active_documents_count', 0) or 0)
+    pending = int(getattr(store, 'pending_documents_count', 0) or 0)
+    failed = int(getattr(store, 'failed_documents_count', 0) or 0)
+    
+    counts = {
+        'active': active,
+        'pending': pending,
+        'failed': failed,
+        'total': active + pending + failed,
+    }
+    
+    logger.debug(f"Document counts for {store.name}: {counts}")
+    return counts
 
 
 def health_check(store_name: str) -> dict[str, Any]:
@@ -503,9 +558,8 @@ def health_check(store_name: str) -> dict[str, Any]:
         health["accessible"] = True
         logger.debug(f"Store accessible: {store.name}")
         
-        # Get document counts
-        logger.debug("Getting document counts...")
-        doc_counts = list_documents(store_name)
+        # Get document counts from the store we just fetched
+        doc_counts = get_document_counts(store)
         health["document_count"] = doc_counts['total']
         
         if health["document_count"] == 0:
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from .client import execute_sparql_query, get_entity
+from .client import execute_sparql_query, get_entities
 from .models import Relationship
 
 
@@ -29,9 +29,10 @@ def get_direct_relationships(
         httpx.HTTPError: If the request fails
         ValueError: If the query fails or returns invalid data
     """
-    # Fetch entity labels for context
-    entity1 = get_entity(entity_id1)
-    entity2 = get_entity(entity_id2)
+    # Fetch entity labels for context (one batched request for both)
+    entities = get_entities([entity_id1, entity_id2])
+    entity1 = entities[entity_id1]
+    entity2 = entities[entity_id2]
 
     # SPARQL query to find direct relationships between the two entities
     # SPARQL query explanation:
@@ -1,8 +1,13 @@
 """Entity search and disambiguation functionality."""
 
+import functools
+
 from .client import get_entity, search_entities
 from .models import EntitySearchResult, WikidataEntity
 
+# Number of entities memoized by get_person_by_id
+_PERSON_CACHE_SIZE = 1024
+
 
 def search_person(
     name: str,
@@ -49,7 +54,9 @@ def get_person_by_id(entity_id: str, timeout: float = 10.0) -> WikidataEntity:
     Fetch a person's data from Wikidata by entity ID.
 
     This is a convenience wrapper around get_entity that's semantically
-    clearer when working specifically with people.
+    clearer when working specifically with people. Results are memoized for
+    the lifetime of the process (Wikidata entities change slowly); each call
+    returns a copy, so callers may modify it freely.
 
     Args:
         entity_id: Wikidata entity ID (e.g., "Q42")
@@ -62,4 +69,10 @@ def get_person_by_id(entity_id: str, timeout: float = 10.0) -> WikidataEntity:
         httpx.HTTPError: If the request fails
         ValueError: If entity not found
     """
+    return _get_person_cached(entity_id, timeout).model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=_PERSON_CACHE_SIZE)
+def _get_person_cached(entity_id: str, timeout: float) -> WikidataEntity:
+    """Fetch an entity from Wikidata; failures are not cached."""
     return get_entity(entity_id, timeout=timeout)
@@ -15,9 +15,11 @@ from .image_downloader import (
 )
 from .source_aggregator import fetch_sources_for_entity, process_existing_sources
 from .source_scanner import (
+    UnprocessedSource,
     scan_raw_sources_directory,
     detect_unprocessed_sources,
     validate_manual_source,
+    validate_sources_parallel,
     get_source_statistics,
 )
 from .validation import (
@@ -37,8 +39,10 @@ __all__ = [
     "fetch_sources_for_entity",
     "process_existing_sources",
     "scan_raw_sources_directory",
+    "UnprocessedSource",
     "detect_unprocessed_sources",
     "validate_manual_source",
+    "validate_sources_parallel",
     "get_source_statistics",
     "fetch_all_images",
     "scan_entity_images",
@@ -2,6 +2,7 @@
 
 import hashlib
 import logging
+import os
 from pathlib import Path
 
 from ..models import WikidataEntity, Source
@@ -10,7 +11,7 @@ from .wikipedia_fetcher import fetch_wikipedia_source
 from .scholar_fetcher import fetch_scholar_sources
 from .arxiv_fetcher import fetch_arxiv_sources
 from .pdf_extractor import extract_pdf_text
-from .source_scanner import detect_unprocessed_sources
+from .source_scanner import UnprocessedSource, detect_unprocessed_sources
 from .utils import (
     get_original_file_path,
     get_entity_directory,
@@ -22,6 +23,28 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+def _root_prefix(raw_sources_dir: Path) -> str:
+    """Get the string prefix that stored content paths are made relative to."""
+    return os.path.join(str(raw_sources_dir.parent), "")
+
+
+def _stored_path(path: Path, root_prefix: str) -> str:
+    """
+    Get a path relative to the data directory by prefix slicing.
+
+    Args:
+        path: Path inside the raw sources directory
+        root_prefix: Prefix from _root_prefix
+
+    Returns:
+        Relative path string, or the full path if outside the data directory
+    """
+    path_str = str(path)
+    if path_str.startswith(root_prefix):
+        return path_str[len(root_prefix):]
+    return path_str
+
+
 def fetch_sources_for_entity(
     db: SourceDatabase,
     raw_sources_dir: Path,
@@ -59,7 +82,7 @@ def fetch_sources_for_entity(
             if wiki_result:
                 sources_with_content.append(wiki_result)
         except Exception as e:
-            logger.error(f"Failed to fetch Wikipedia for {entity.label}: {e}")
+            logger.error("Failed to fetch Wikipedia for %s: %s", entity.label, e)
 
     # Fetch Google Scholar (full text PDFs only)
     try:
@@ -68,7 +91,7 @@ def fetch_sources_for_entity(
         )
         sources_with_content.extend(scholar_results)
     except Exception as e:
-        logger.error(f"Failed to fetch Scholar for {entity.label}: {e}")
+        logger.error("Failed to fetch Scholar for %s: %s", entity.label, e)
 
     # Fetch arXiv
     try:
@@ -77,9 +100,9 @@ def fetch_sources_for_entity(
         )
         sources_with_content.extend(arxiv_results)
     except Exception as e:
-        logger.error(f"Failed to fetch arXiv for {entity.label}: {e}")
+        logger.error("Failed to fetch arXiv for %s: %s", entity.label, e)
 
-    logger.info(f"Fetched {len(sources_with_content)} sources for {entity.label}")
+    logger.info("Fetched %d sources for %s", len(sources_with_content), entity.label)
     return sources_with_content
 
 
@@ -102,17 +125,20 @@ def _fetch_and_store_wikipedia(
     # Check if already in database
     existing = db.get_source_by_url(entity.wikipedia_url)
     if existing:
-        logger.info(f"Wikipedia source already exists: {existing.source_id}")
+        logger.info("Wikipedia source already exists: %s", existing.source_id)
         
         # Check if original HTML file exists
-        html_path = get_original_file_path(raw_sources_dir, existing.url, "html")
+        html_path = get_original_file_path(
+            raw_sources_dir, existing.url, "html", ensure=False
+        )
         if not html_path.exists():
-            logger.info(f"Original HTML missing for {existing.source_id}, will save it")
+            html_path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info("Original HTML missing for %s, will save it", existing.source_id)
             # Fetch to get the HTML bytes
             source, content, html_bytes = fetch_wikipedia_source(entity)
             # Save the original HTML
             html_path.write_bytes(html_bytes)
-            logger.debug(f"Saved original HTML to {html_path}")
+            logger.debug("Saved original HTML to %s", html_path)
             return existing, content
         
         # We need the content, so read it from disk if available
@@ -122,7 +148,7 @@ def _fetch_and_store_wikipedia(
                 content = content_path.read_text(encoding="utf-8")
                 return existing, content
             except Exception as e:
-                logger.warning(f"Failed to read stored content for {existing.source_id}: {e}")
+                logger.warning("Failed to read stored content for %s: %s", existing.source_id, e)
                 # Fall through to re-fetch if content missing
         
         # If content missing or not stored path, re-fetch
@@ -130,9 +156,9 @@ def _fetch_and_store_wikipedia(
     # Fetch new source
     source, content, html_bytes = fetch_wikipedia_source(entity)
 
-    # Calculate content hash
-    content_hash = hashlib.sha256(content.encode()).hexdigest()
-    source.content_hash = content_hash
+    # Encode once: the same bytes feed the hash and the file write
+    encoded = content.encode("utf-8")
+    source.content_hash = hashlib.sha256(encoded).hexdigest()
     
     # Mark as auto-fetched
     source.is_manual = False
@@ -143,15 +169,15 @@ def _fetch_and_store_wikipedia(
 
     # Save extracted text content to disk
     content_path = source_dir / "content.txt"
-    content_path.write_text(content, encoding="utf-8")
-    source.stored_content_path = str(content_path.relative_to(raw_sources_dir.parent))
+    content_path.write_bytes(encoded)
+    source.stored_content_path = _stored_path(content_path, _root_prefix(raw_sources_dir))
 
-    logger.debug(f"Saved content to {content_path}")
+    logger.debug("Saved content to %s", content_path)
 
     # Save original HTML file
     html_path = source_dir / "original.html"
     html_path.write_bytes(html_bytes)
-    logger.debug(f"Saved original HTML to {html_path}")
+    logger.debug("Saved original HTML to %s", html_path)
 
     # Add to database
     source = db.add_source(source)
@@ -179,28 +205,35 @@ def _fetch_and_store_scholar(
     """
     scholar_results = fetch_scholar_sources(entity, max_results)
     stored_results = []
+    new_sources = []
+    root_prefix = _root_prefix(raw_sources_dir)
+
+    # Check all URLs against the database in one query
+    existing_by_url = db.get_sources_by_urls([source.url for source, _, _ in scholar_results])
 
     for source, content, pdf_bytes in scholar_results:
-        # Check if URL already exists in database
-        existing = db.get_source_by_url(source.url)
+        existing = existing_by_url.get(source.url)
         if existing:
-            logger.info(f"Scholar source already exists: {existing.source_id}")
+            logger.info("Scholar source already exists: %s", existing.source_id)
             
             # Check if original PDF file exists, save it if missing
-            pdf_path = get_original_file_path(raw_sources_dir, existing.url, "pdf")
+            pdf_path = get_original_file_path(
+                raw_sources_dir, existing.url, "pdf", ensure=False
+            )
             if not pdf_path.exists():
-                logger.info(f"Original PDF missing for {existing.source_id}, saving it")
+                pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                logger.info("Original PDF missing for %s, saving it", existing.source_id)
                 pdf_path.write_bytes(pdf_bytes)
-                logger.debug(f"Saved original PDF to {pdf_path}")
+                logger.debug("Saved original PDF to %s", pdf_path)
             
             # If exists, we use the existing source metadata but the fetched content
             # (or we could read from disk, but we already have the content here from fetch)
             stored_results.append((existing, content))
             continue
 
-        # Calculate content hash
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        source.content_hash = content_hash
+        # Encode once: the same bytes feed the hash and the file write
+        encoded = content.encode("utf-8")
+        source.content_hash = hashlib.sha256(encoded).hexdigest()
         
         # Mark as auto-fetched
         source.is_manual = False
@@ -211,21 +244,24 @@ def _fetch_and_store_scholar(
 
         # Save extracted text content to disk
         content_path = source_dir / "content.txt"
-        content_path.write_text(content, encoding="utf-8")
-        source.stored_content_path = str(content_path.relative_to(raw_sources_dir.parent))
+        content_path.write_bytes(encoded)
+        source.stored_content_path = _stored_path(content_path, root_prefix)
 
-        logger.debug(f"Saved Scholar content to {content_path}")
+        logger.debug("Saved Scholar content to %s", content_path)
 
         # Save original PDF file
         pdf_path = source_dir / "original.pdf"
         pdf_path.write_bytes(pdf_bytes)
-        logger.debug(f"Saved original PDF to {pdf_path}")
+        logger.debug("Saved original PDF to %s", pdf_path)
 
-        # Add to database
-        source = db.add_source(source)
+        # Later results with the same URL reuse this source
+        existing_by_url[source.url] = source
+        new_sources.append(source)
         stored_results.append((source, content))
 
-        logger.info(f"Stored Scholar source: {source.source_id} - {source.title}")
+    # Add all new sources to database in a single transaction
+    for source in db.add_sources(new_sources):
+        logger.info("Stored Scholar source: %s - %s", source.source_id, source.title)
 
     return stored_results
 
@@ -250,26 +286,33 @@ def _fetch_and_store_arxiv(
     """
     arxiv_results = fetch_arxiv_sources(entity, max_results)
     stored_results = []
+    new_sources = []
+    root_prefix = _root_prefix(raw_sources_dir)
+
+    # Check all URLs against the database in one query
+    existing_by_url = db.get_sources_by_urls([source.url for source, _, _ in arxiv_results])
 
     for source, content, pdf_bytes in arxiv_results:
-        # Check if URL already exists in database
-        existing = db.get_source_by_url(source.url)
+        existing = existing_by_url.get(source.url)
         if existing:
-            logger.info(f"arXiv source already exists: {existing.source_id}")
+            logger.info("arXiv source already exists: %s", existing.source_id)
             
             # Check if original PDF file exists, save it if missing
-            pdf_path = get_original_file_path(raw_sources_dir, existing.url, "pdf")
+            pdf_path = get_original_file_path(
+                raw_sources_dir, existing.url, "pdf", ensure=False
+            )
             if not pdf_path.exists():
-                logger.info(f"Original PDF missing for {existing.source_id}, saving it")
+                pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                logger.info("Original PDF missing for %s, saving it", existing.source_id)
                 pdf_path.write_bytes(pdf_bytes)
-                logger.debug(f"Saved original PDF to {pdf_path}")
+                logger.debug("Saved original PDF to %s", pdf_path)
             
             stored_results.append((existing, content))
             continue
 
-        # Calculate content hash
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        source.content_hash = content_hash
+        # Encode once: the same bytes feed the hash and the file write
+        encoded = content.encode("utf-8")
+        source.content_hash = hashlib.sha256(encoded).hexdigest()
         
         # Mark as auto-fetched
         source.is_manual = False
@@ -280,21 +323,24 @@ def _fetch_and_store_arxiv(
 
         # Save extracted text content to disk
         content_path = source_dir / "content.txt"
-        content_path.write_text(content, encoding="utf-8")
-        source.stored_content_path = str(content_path.relative_to(raw_sources_dir.parent))
+        content_path.write_bytes(encoded)
+        source.stored_content_path = _stored_path(content_path, root_prefix)
 
-        logger.debug(f"Saved arXiv content to {content_path}")
+        logger.debug("Saved arXiv content to %s", content_path)
 
         # Save original PDF file
         pdf_path = source_dir / "original.pdf"
         pdf_path.write_bytes(pdf_bytes)
-        logger.debug(f"Saved original PDF to {pdf_path}")
+        logger.debug("Saved original PDF to %s", pdf_path)
 
-        # Add to database
-        source = db.add_source(source)
+        # Later results with the same URL reuse this source
+        existing_by_url[source.url] = source
+        new_sources.append(source)
         stored_results.append((source, content))
 
-        logger.info(f"Stored arXiv source: {source.source_id} - {source.title}")
+    # Add all new sources to database in a single transaction
+    for source in db.add_sources(new_sources):
+        logger.info("Stored arXiv source: %s - %s", source.source_id, source.title)
 
     return stored_results
 
@@ -320,7 +366,7 @@ def process_existing_sources(
     """
     raw_sources_dir = Path(raw_sources_dir)
     
-    logger.info(f"Scanning for unprocessed sources in {raw_sources_dir}")
+    logger.info("Scanning for unprocessed sources in %s", raw_sources_dir)
     
     # Detect unprocessed sources
     unprocessed_sources = detect_unprocessed_sources(
@@ -331,59 +377,62 @@ def process_existing_sources(
         logger.info("No unprocessed sources found")
         return []
     
-    logger.info(f"Found {len(unprocessed_sources)} unprocessed sources")
+    logger.info("Found %d unprocessed sources", len(unprocessed_sources))
     
     processed_results: list[tuple[Source, str]] = []
+    root_prefix = _root_prefix(raw_sources_dir)
     
     for source_meta in unprocessed_sources:
         try:
-            result = _process_single_source(db, raw_sources_dir, source_meta)
+            result = _process_single_source(db, root_prefix, source_meta)
             if result:
                 processed_results.append(result)
         except Exception as e:
             logger.error(
-                f"Failed to process source {source_meta.get('source_dir')}: {e}"
+                "Failed to process source %s: %s", source_meta.source_dir, e
             )
             continue
     
-    logger.info(f"Successfully processed {len(processed_results)} sources")
+    logger.info("Successfully processed %d sources", len(processed_results))
     return processed_results
 
 
 def _process_single_source(
     db: SourceDatabase,
-    raw_sources_dir: Path,
-    source_meta: dict,
+    root_prefix: str,
+    source_meta: UnprocessedSource,
 ) -> tuple[Source, str] | None:
     """
     Process a single source from metadata.
     
     Args:
         db: SourceDatabase instance
-        raw_sources_dir: Base directory for raw sources
-        source_meta: Metadata dictionary from source scanner
+        root_prefix: Data directory prefix for stored content paths
+        source_meta: Unprocessed source from the source scanner
     
     Returns:
         Tuple of (Source, content) if successful, None otherwise
     """
-    source_dir = Path(source_meta["source_dir"])
-    original_file = Path(source_meta["original_file"])
-    file_type = source_meta["file_type"]
+    source_dir = Path(source_meta.source_dir)
+    original_file = Path(source_meta.original_file)
+    file_type = source_meta.file_type
     
-    logger.info(f"Processing source: {source_dir.name}")
+    logger.info("Processing source: %s", source_dir.name)
     
     # Extract content
     content = _extract_content_from_file(original_file, file_type, source_dir)
     
     if not content or len(content.strip()) < 50:
-        logger.warning(f"Content too short or empty for {source_dir}")
+        logger.warning("Content too short or empty for %s", source_dir)
         return None
     
-    # Calculate content hash
-    content_hash = hashlib.sha256(content.encode()).hexdigest()
+    # Calculate content hash (encoded once; the bytes are reused if
+    # content.txt has to be written below)
+    encoded = content.encode("utf-8")
+    content_hash = hashlib.sha256(encoded).hexdigest()
     
     # Create Source object
-    source_id = generate_source_id(source_meta["pseudo_url"])
+    source_id = generate_source_id(source_meta.pseudo_url)
     
     # Determine if this is a manual source based on directory name
     is_manual = source_dir.name.startswith("manual")
@@ -404,7 +453,7 @@ def _process_single_source(
         source_id=source_id,
         type=source_type,
         title=f"Manual source: {source_dir.name}",
-        url=source_meta["pseudo_url"],
+        url=source_meta.pseudo_url,
         retrieved_at=get_iso_timestamp(),
         content_hash=content_hash,
         is_manual=is_manual,
@@ -413,20 +462,15 @@ def _process_single_source(
     # Save content.txt if it doesn't exist
     content_txt = source_dir / "content.txt"
     if not content_txt.exists():
-        content_txt.write_text(content, encoding="utf-8")
-        logger.debug(f"Saved extracted content to {content_txt}")
+        content_txt.write_bytes(encoded)
+        logger.debug("Saved extracted content to %s", content_txt)
     
-    # Set stored content path (relative to data/)
-    try:
-        rel_path = content_txt.relative_to(raw_sources_dir.parent)
-        source.stored_content_path = str(rel_path)
-    except ValueError:
-        # If relative path fails, use absolute
-        source.stored_content_path = str(content_txt)
+    # Set stored content path (relative to data/, absolute if outside it)
+    source.stored_content_path = _stored_path(content_txt, root_prefix)
     
     # Add to database
     source = db.add_source(source)
-    logger.info(f"Added source to database: {source.source_id} - {source.title}")
+    logger.info("Added source to database: %s - %s", source.source_id, source.title)
     
     return source, content
 
@@ -448,15 +492,15 @@ def _extract_content_from_file(
     # Check if content.txt already exists
     content_txt = source_dir / "content.txt"
     if content_txt.exists():
-        logger.debug(f"Reading existing content.txt from {content_txt}")
+        logger.debug("Reading existing content.txt from %s", content_txt)
         return content_txt.read_text(encoding="utf-8")
     
     # Extract based on file type
     if file_type == "pdf":
-        logger.debug(f"Extracting text from PDF: {original_file}")
+        logger.debug("Extracting text from PDF: %s", original_file)
         return extract_pdf_text(original_file)
     elif file_type == "html":
-        logger.debug(f"Reading HTML file: {original_file}")
+        logger.debug("Reading HTML file: %s", original_file)
         # For HTML, just read the file content
         return original_file.read_text(encoding="utf-8")
     else:
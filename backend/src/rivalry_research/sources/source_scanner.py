@@ -1,6 +1,9 @@
 """Scans and detects sources in the raw_sources directory."""
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from ..models import Source
@@ -10,13 +13,31 @@ from .utils import extract_entity_id_from_path
 
 logger = logging.getLogger(__name__)
 
+# Maximum worker threads used to scan source directories
+_SCAN_MAX_WORKERS = 16
+
+
+@dataclass(slots=True)
+class UnprocessedSource:
+    """A source directory on disk that is not yet in the database."""
+
+    source_dir: str
+    original_file: str
+    file_type: str
+    entity_name: str
+    entity_id: str
+    has_content_txt: bool
+    pseudo_url: str
+
 
 class SourceScanResult:
     """Result of scanning the raw_sources directory."""
 
+    __slots__ = ("sources_in_db", "sources_not_in_db", "invalid_sources")
+
     def __init__(self):
         self.sources_in_db: list[Source] = []
-        self.sources_not_in_db: list[dict] = []
+        self.sources_not_in_db: list[UnprocessedSource] = []
         self.invalid_sources: list[dict] = []
 
 
@@ -40,101 +61,125 @@ def scan_raw_sources_directory(
     raw_sources_dir = Path(raw_sources_dir)
 
     if not raw_sources_dir.exists():
-        logger.warning(f"Raw sources directory does not exist: {raw_sources_dir}")
+        logger.warning("Raw sources directory does not exist: %s", raw_sources_dir)
         return result
 
-    logger.info(f"Scanning raw sources directory: {raw_sources_dir}")
+    logger.info("Scanning raw sources directory: %s", raw_sources_dir)
 
-    # Get all entity directories
-    entity_dirs = [d for d in raw_sources_dir.iterdir() if d.is_dir()]
+    # Collect all source directories first (os.scandir caches the file type,
+    # avoiding a stat per entry), then scan them in parallel
+    all_source_dirs: list[tuple[str, str, Path]] = []
 
-    for entity_dir in entity_dirs:
-        # Extract entity ID from directory name (e.g., "Max_Planck_Q9021" -> "Q9021")
-        entity_id = extract_entity_id_from_path(entity_dir)
-        
-        # Skip if entity filter is set and doesn't match
-        if entity_filter and entity_id != entity_filter:
-            continue
+    with os.scandir(raw_sources_dir) as entity_entries:
+        for entity_entry in entity_entries:
+            if not entity_entry.is_dir(follow_symlinks=False):
+                continue
 
-        logger.debug(f"Scanning entity directory: {entity_dir.name}")
+            # Extract entity ID from directory name (e.g., "Max_Planck_Q9021" -> "Q9021")
+            entity_id = extract_entity_id_from_path(Path(entity_entry.path))
 
-        # Get all source directories within this entity
-        source_dirs = [d for d in entity_dir.iterdir() if d.is_dir()]
+            # Skip if entity filter is set and doesn't match
+            if entity_filter and entity_id != entity_filter:
+                continue
 
-        for source_dir in source_dirs:
-            _scan_source_directory(source_dir, db, result, entity_dir.name, entity_id)
+            logger.debug("Scanning entity directory: %s", entity_entry.name)
+
+            # Get all source directories within this entity
+            with os.scandir(entity_entry.path) as source_entries:
+                for source_entry in source_entries:
+                    if source_entry.is_dir(follow_symlinks=False):
+                        all_source_dirs.append(
+                            (entity_entry.name, entity_id, Path(source_entry.path))
+                        )
+
+    if all_source_dirs:
+        max_workers = min(_SCAN_MAX_WORKERS, len(all_source_dirs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scanned = list(executor.map(_scan_source_directory, all_source_dirs))
+    else:
+        scanned = []
+
+    # Check which sources are already in the database with a single batched query.
+    # For manual sources, we use a pseudo-URL based on the file path
+    pseudo_urls = [
+        metadata.pseudo_url for category, metadata in scanned if category == "candidate"
+    ]
+    existing_sources = db.get_sources_by_urls(pseudo_urls)
+
+    for category, metadata in scanned:
+        if category == "invalid":
+            result.invalid_sources.append(metadata)
+            continue
+
+        existing_source = existing_sources.get(metadata.pseudo_url)
+        if existing_source:
+            logger.debug("Source already in DB: %s", existing_source.source_id)
+            result.sources_in_db.append(existing_source)
+        else:
+            # Source not in DB - needs processing
+            logger.debug("Source not in DB: %s", metadata.source_dir)
+            result.sources_not_in_db.append(metadata)
 
     logger.info(
-        f"Scan complete: {len(result.sources_in_db)} in DB, "
-        f"{len(result.sources_not_in_db)} not in DB, "
-        f"{len(result.invalid_sources)} invalid"
+        "Scan complete: %d in DB, %d not in DB, %d invalid",
+        len(result.sources_in_db),
+        len(result.sources_not_in_db),
+        len(result.invalid_sources),
     )
 
     return result
 
 
 def _scan_source_directory(
-    source_dir: Path,
-    db: SourceDatabase,
-    result: SourceScanResult,
-    entity_name: str,
-    entity_id: str,
-) -> None:
+    source_entry: tuple[str, str, Path],
+) -> tuple[str, dict | UnprocessedSource]:
     """
     Scan a single source directory and categorize it.
 
+    Runs in a worker thread, so it only touches the filesystem; database
+    lookups are batched by the caller.
+
     Args:
-        source_dir: Path to source directory (e.g., manual_001, wikipedia, scholar_002)
-        db: SourceDatabase instance
-        result: SourceScanResult to populate
-        entity_name: Entity directory name
-        entity_id: Entity ID (e.g., "Q9021")
+        source_entry: Tuple of (entity_name, entity_id, source_dir) where
+            entity_name is the entity directory name, entity_id is the entity
+            ID (e.g., "Q9021") and source_dir is the path to the source
+            directory (e.g., manual_001, wikipedia, scholar_002)
+
+    Returns:
+        Tuple of (category, metadata) where category is "invalid" (metadata
+        is a dict with the reason) or "candidate" (metadata is an
+        UnprocessedSource; it may or may not be in the database)
     """
-    # Look for original file (PDF or HTML)
-    original_pdf = source_dir / "original.pdf"
-    original_html = source_dir / "original.html"
-    content_txt = source_dir / "content.txt"
+    entity_name, entity_id, source_dir = source_entry
+
+    # List the directory once instead of probing each expected file
+    with os.scandir(source_dir) as entries:
+        names = {entry.name for entry in entries}
 
-    # Determine which original file exists
-    if original_pdf.exists():
-        original_file = original_pdf
+    # Determine which original file exists (PDF or HTML)
+    if "original.pdf" in names:
         file_type = "pdf"
-    elif original_html.exists():
-        original_file = original_html
+    elif "original.html" in names:
         file_type = "html"
     else:
-        logger.warning(f"No original file found in {source_dir}")
-        result.invalid_sources.append({
+        logger.warning("No original file found in %s", source_dir)
+        return "invalid", {
             "path": str(source_dir),
             "reason": "No original.pdf or original.html found",
             "entity_id": entity_id,
-        })
-        return
-
-    # Check if this source is already in the database
-    # For manual sources, we use a pseudo-URL based on the file path
-    pseudo_url = _generate_pseudo_url(entity_id, source_dir.name, file_type)
-    
-    existing_source = db.get_source_by_url(pseudo_url)
-
-    if existing_source:
-        logger.debug(f"Source already in DB: {existing_source.source_id}")
-        result.sources_in_db.append(existing_source)
-    else:
-        # Source not in DB - needs processing
-        logger.debug(f"Source not in DB: {source_dir}")
-        
-        # Store metadata about unprocessed source
-        metadata = {
-            "source_dir": str(source_dir),
-            "original_file": str(original_file),
-            "file_type": file_type,
-            "entity_name": entity_name,
-            "entity_id": entity_id,
-            "has_content_txt": content_txt.exists(),
-            "pseudo_url": pseudo_url,
         }
-        result.sources_not_in_db.append(metadata)
+
+    # Store metadata about the source in case it needs processing
+    metadata = UnprocessedSource(
+        source_dir=str(source_dir),
+        original_file=str(source_dir / f"original.{file_type}"),
+        file_type=file_type,
+        entity_name=entity_name,
+        entity_id=entity_id,
+        has_content_txt="content.txt" in names,
+        pseudo_url=_generate_pseudo_url(entity_id, source_dir.name, file_type),
+    )
+    return "candidate", metadata
 
 
 def _generate_pseudo_url(entity_id: str, source_dir_name: str, file_type: str) -> str:
@@ -156,7 +201,7 @@ def detect_unprocessed_sources(
     raw_sources_dir: Path,
     db: SourceDatabase,
     entity_filter: str | None = None,
-) -> list[dict]:
+) -> list[UnprocessedSource]:
     """
     Detect sources that exist on disk but are not in the database.
 
@@ -166,7 +211,7 @@ def detect_unprocessed_sources(
         entity_filter: Optional entity ID to scan only that entity's sources
 
     Returns:
-        List of metadata dictionaries for unprocessed sources
+        List of UnprocessedSource entries
     """
     result = scan_raw_sources_directory(raw_sources_dir, db, entity_filter)
     return result.sources_not_in_db
@@ -217,6 +262,33 @@ def validate_manual_source(source_dir: Path) -> tuple[bool, str]:
     return True, "Valid"
 
 
+def _validate_source_dir(source_dir: Path) -> tuple[Path, bool, str]:
+    """Validate a source directory, returning its path with the result."""
+    is_valid, message = validate_manual_source(source_dir)
+    return source_dir, is_valid, message
+
+
+def validate_sources_parallel(source_dirs: list[Path]) -> list[tuple[Path, bool, str]]:
+    """
+    Validate multiple source directories using a process pool.
+
+    PDF text extraction is CPU-bound, so validation is spread across
+    processes rather than threads.
+
+    Args:
+        source_dirs: Paths to source directories
+
+    Returns:
+        List of (source_dir, is_valid, message) tuples in input order
+    """
+    if len(source_dirs) <= 1:
+        return [_validate_source_dir(source_dir) for source_dir in source_dirs]
+
+    max_workers = min(os.cpu_count() or 1, len(source_dirs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_validate_source_dir, source_dirs, chunksize=4))
+
+
 def get_source_statistics(raw_sources_dir: Path, db: SourceDatabase) -> dict:
     """
     Get statistics about sources in the raw_sources directory.
@@ -1,17 +1,45 @@
 """Utility functions for source management."""
 
 import hashlib
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Single-pass translation: invalid filename characters become "_",
+# control characters are removed
+_INVALID_CHARS = '<>:"/\\|?*'
+_CONTROL_CHARS = [*range(0x20), 0x7F]
+_FILENAME_TRANSLATION = str.maketrans(
+    {**dict.fromkeys(_INVALID_CHARS, "_"), **dict.fromkeys(_CONTROL_CHARS)}
+)
+_ENTITY_NAME_TRANSLATION = str.maketrans(
+    {**dict.fromkeys(_INVALID_CHARS + " ", "_"), **dict.fromkeys(_CONTROL_CHARS)}
+)
+
+_UNDERSCORE_WHITESPACE_RE = re.compile(r"[_\s]+")
+_UNDERSCORE_RE = re.compile(r"_+")
+_ENTITY_ID_RE = re.compile(r"(?:^|_)(Q\d+)$")
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create a directory (and parents) if it doesn't exist.
+
+    Checked on every call rather than remembered, since directories can be
+    deleted while the process runs (e.g. by `rivalry clean`); the common
+    case costs a single stat instead of a failing mkdir.
+    """
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
 
 def generate_source_id(url: str, prefix: str = "src") -> str:
     """
     Generate a unique source identifier based on URL.
     
     Uses URL hash to ensure the same source always gets the same ID,
-    which aids in deduplication and debugging.
+    which aids in deduplication and debugging. BLAKE2b is used because it
+    is fast on short inputs; the ID is not security sensitive.
     
     Args:
         url: Source URL (used for generating unique hash)
@@ -20,7 +48,7 @@ def generate_source_id(url: str, prefix: str = "src") -> str:
     Returns:
         Unique source ID (e.g., "src_a3f2b1c4d5e6")
     """
-    url_hash = hashlib.sha256(url.encode()).hexdigest()[:12]
+    url_hash = hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
     return f"{prefix}_{url_hash}"
 
 
@@ -28,6 +56,9 @@ def hash_url(url: str) -> str:
     """
     Create a hash from a URL for use in file paths.
     
+    Stays on SHA-256 (unlike generate_source_id): it names directories of
+    files already on disk, so changing it would orphan them.
+    
     Args:
         url: Source URL
     
@@ -48,18 +79,18 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     Returns:
         Safe filename
     """
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f]', '', sanitized)
+    # Replace invalid characters and remove control characters
+    sanitized = filename.translate(_FILENAME_TRANSLATION)
     # Replace multiple underscores/spaces with single underscore
-    sanitized = re.sub(r'[_\s]+', '_', sanitized)
+    sanitized = _UNDERSCORE_WHITESPACE_RE.sub('_', sanitized)
     # Trim and limit length
     sanitized = sanitized.strip('._')[:max_length]
     return sanitized or "unnamed"
 
 
-def get_content_path(base_dir: Path, url: str, extension: str = "txt") -> Path:
+def get_content_path(
+    base_dir: Path, url: str, extension: str = "txt", ensure: bool = True
+) -> Path:
     """
     Generate a storage path for source content based on URL hash.
     
@@ -67,17 +98,21 @@ def get_content_path(base_dir: Path, url: str, extension: str = "txt") -> Path:
         base_dir: Base directory for raw sources
         url: Source URL
         extension: File extension (default: "txt")
+        ensure: Create the containing directory if it doesn't exist
     
     Returns:
         Path for storing the content
     """
     url_hash = hash_url(url)
     content_dir = base_dir / url_hash
-    content_dir.mkdir(parents=True, exist_ok=True)
+    if ensure:
+        _ensure_dir(content_dir)
     return content_dir / f"content.{extension}"
 
 
-def get_original_file_path(base_dir: Path, url: str, extension: str) -> Path:
+def get_original_file_path(
+    base_dir: Path, url: str, extension: str, ensure: bool = True
+) -> Path:
     """
     Generate a storage path for the original source file based on URL hash.
     
@@ -85,13 +120,15 @@ def get_original_file_path(base_dir: Path, url: str, extension: str) -> Path:
         base_dir: Base directory for raw sources
         url: Source URL
         extension: File extension (e.g., "pdf", "html")
+        ensure: Create the containing directory if it doesn't exist
     
     Returns:
         Path for storing the original file
     """
     url_hash = hash_url(url)
     content_dir = base_dir / url_hash
-    content_dir.mkdir(parents=True, exist_ok=True)
+    if ensure:
+        _ensure_dir(content_dir)
     return content_dir / f"original.{extension}"
 
 
@@ -106,14 +143,10 @@ def sanitize_entity_name(name: str, max_length: int = 50) -> str:
     Returns:
         Sanitized name safe for filesystem
     """
-    # Replace spaces with underscores
-    sanitized = name.replace(' ', '_')
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', sanitized)
-    # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f]', '', sanitized)
+    # Replace spaces and invalid characters, remove control characters
+    sanitized = name.translate(_ENTITY_NAME_TRANSLATION)
     # Replace multiple underscores with single underscore
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _UNDERSCORE_RE.sub('_', sanitized)
     # Trim and limit length
     sanitized = sanitized.strip('._')[:max_length]
     return sanitized or "unknown"
@@ -134,7 +167,7 @@ def get_entity_directory(base_dir: Path, entity_name: str, entity_id: str) -> Pa
     safe_name = sanitize_entity_name(entity_name)
     entity_folder = f"{safe_name}_{entity_id}"
     entity_dir = base_dir / entity_folder
-    entity_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(entity_dir)
     return entity_dir
 
 
@@ -155,18 +188,25 @@ def get_source_directory(entity_dir: Path, source_type: str) -> tuple[Path, int]
     # Wikipedia gets its own single directory
     if source_type == "wikipedia":
         source_dir = entity_dir / "wikipedia"
-        source_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(source_dir)
         return source_dir, 0
     
     # Scholar and arXiv get numbered directories
-    # Find next available number
-    counter = 1
-    while True:
-        source_dir = entity_dir / f"{source_type}_{counter:03d}"
-        if not source_dir.exists():
-            source_dir.mkdir(parents=True, exist_ok=True)
-            return source_dir, counter
-        counter += 1
+    # Next number is one past the highest existing index (single directory read)
+    prefix = f"{source_type}_"
+    max_index = 0
+    with os.scandir(entity_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix):
+                try:
+                    max_index = max(max_index, int(entry.name[len(prefix):]))
+                except ValueError:
+                    pass
+    
+    counter = max_index + 1
+    source_dir = entity_dir / f"{source_type}_{counter:03d}"
+    source_dir.mkdir(parents=True, exist_ok=True)
+    return source_dir, counter
 
 
 def get_iso_timestamp() -> str:
@@ -191,14 +231,9 @@ def extract_entity_id_from_path(path: Path) -> str:
     Returns:
         Entity ID (e.g., "Q9021") or "unknown" if not found
     """
-    dir_name = path.name
-    # Match pattern like Q followed by digits at the end
-    match = re.search(r'_(Q\d+)$', dir_name)
-    if match:
-        return match.group(1)
-    
-    # Try without underscore prefix (in case dir is just "Q9021")
-    match = re.search(r'^(Q\d+)$', dir_name)
+    # Match Q followed by digits at the end, after an underscore or as the
+    # whole name (in case dir is just "Q9021")
+    match = _ENTITY_ID_RE.search(path.name)
     if match:
         return match.group(1)
     
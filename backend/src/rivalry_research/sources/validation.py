@@ -101,8 +101,9 @@ def compute_sources_summary(sources: dict[str, Source]) -> SourcesSummary:
     Returns:
         SourcesSummary with aggregate statistics
     """
+    # Every value below is computed from already validated Source models
     if not sources:
-        return SourcesSummary(
+        return SourcesSummary.from_trusted(
             total_sources=0,
             by_type={},
             primary_sources=0,
@@ -138,7 +139,7 @@ def compute_sources_summary(sources: dict[str, Source]) -> SourcesSummary:
         except Exception as e:
             logger.debug(f"Could not compute date range: {e}")
     
-    return SourcesSummary(
+    return SourcesSummary.from_trusted(
         total_sources=len(sources_list),
         by_type=by_type,
         primary_sources=primary_count,
@@ -1,37 +1,87 @@
 """Fetch Wikipedia article content for entities."""
 
+import atexit
 import logging
 import re
+import threading
 import time
-from urllib.parse import unquote, urlparse
+from urllib.parse import quote, unquote, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
+# selectolax (lexbor C parser) is optional; fall back to BeautifulSoup without it
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 from ..models import WikidataEntity, Source
 from .utils import generate_source_id, get_iso_timestamp
 
 logger = logging.getLogger(__name__)
 
-# Wikipedia API endpoint
-WIKIPEDIA_API = "https://en.wikipedia.org/w/api.php"
+# Wikipedia REST endpoint for rendered article HTML
+WIKIPEDIA_REST_HTML = "https://en.wikipedia.org/api/rest_v1/page/html"
 
 # User agent for Wikipedia compliance
 USER_AGENT = "RivalryResearch/0.1.0 (https://github.com/user/rivalry-research)"
 
 # Rate limiting
-_last_request_time = 0.0
 _min_request_interval = 0.5  # 500ms between requests (2 req/sec max per Wikipedia guidelines)
 
+# Text cleanup patterns
+_CITATION_RE = re.compile(r"\[\d+\]")
+_NEWLINES_RE = re.compile(r"\n{3,}")
+_SPACES_RE = re.compile(r" {2,}")
+# Single-pass cleanup: citation brackets together with the whitespace around
+# them (removing a citation can merge the runs on either side), or plain runs
+# of newlines/spaces
+_CLEAN_RE = re.compile(r"[ \n]*(?:\[\d+\][ \n]*)+|\n{3,}| {2,}")
+
+# Document layout for File Search ingestion: metadata header, then article text
+_DOC_TEMPLATE = (
+    "---\nSource: Wikipedia\nArticle: {article}\nEntity ID: {eid}\n"
+    "Entity Name: {label}\nURL: {url}\nDescription: {desc}\n---\n\n{body}"
+)
+
+
+class _RateLimiter:
+    """Enforces a minimum interval between requests using a monotonic clock."""
+
+    __slots__ = ("next_ok",)
+
+    def __init__(self) -> None:
+        self.next_ok = 0.0
+
+    def acquire(self) -> None:
+        """Block until the next request is allowed."""
+        delay = self.next_ok - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_ok = time.monotonic() + _min_request_interval
+
+
+_WIKI_LIMITER = _RateLimiter()
+
+# Shared HTTP client so connections to Wikipedia are kept alive between articles
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
 
-def _rate_limit() -> None:
-    """Enforce rate limiting between Wikipedia requests."""
-    global _last_request_time
-    now = time.time()
-    time_since_last = now - _last_request_time
-    if time_since_last < _min_request_interval:
-        time.sleep(_min_request_interval - time_since_last)
-    _last_request_time = time.time()
+
+def _get_client() -> httpx.Client:
+    """Get the shared Wikipedia HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    headers={"User-Agent": USER_AGENT},
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                )
+                atexit.register(_client.close)
+    return _client
 
 
 def _extract_article_title_from_url(wikipedia_url: str) -> str:
@@ -51,16 +101,33 @@ def _extract_article_title_from_url(wikipedia_url: str) -> str:
     raise ValueError(f"Invalid Wikipedia URL format: {wikipedia_url}")
 
 
-def _clean_html_to_text(html: str) -> str:
-    """
-    Convert Wikipedia HTML to clean plain text.
+def _clean_match(match: re.Match[str]) -> str:
+    """Replacement for _CLEAN_RE matches."""
+    s = match.group(0)
+    if "[" in s:
+        # Drop citations, then collapse the whitespace they were separating
+        s = _CITATION_RE.sub("", s)
+        s = _NEWLINES_RE.sub("\n\n", s)
+        return _SPACES_RE.sub(" ", s)
+    if s[0] == "\n":
+        return "\n\n"
+    return " "
+
+
+def _extract_text_selectolax(html: str) -> str:
+    """Strip non-content elements and extract text using selectolax."""
+    tree = LexborHTMLParser(html)
     
-    Args:
-        html: Raw HTML content from Wikipedia
+    # Remove script/style elements, superscripts and reference text
+    for node in tree.css("script, style, sup, span.reference-text"):
+        node.decompose()
     
-    Returns:
-        Clean plain text
-    """
+    root = tree.body or tree.root
+    return root.text(separator="") if root else ""
+
+
+def _extract_text_bs4(html: str) -> str:
+    """Strip non-content elements and extract text using BeautifulSoup."""
     soup = BeautifulSoup(html, "html.parser")
     
     # Remove script and style elements
@@ -71,17 +138,29 @@ def _clean_html_to_text(html: str) -> str:
     for element in soup.find_all("span", class_="reference-text"):
         element.decompose()
     
-    # Get text and clean up whitespace
-    text = soup.get_text()
+    root = soup.body or soup
+    return root.get_text()
+
+
+def _clean_html_to_text(html: str) -> str:
+    """
+    Convert Wikipedia HTML to clean plain text.
     
-    # Remove citation brackets
-    text = re.sub(r"\[\d+\]", "", text)
+    Uses selectolax when installed, otherwise BeautifulSoup.
     
-    # Clean up multiple newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    Args:
+        html: Raw HTML content from Wikipedia
+    
+    Returns:
+        Clean plain text
+    """
+    if LexborHTMLParser is not None:
+        text = _extract_text_selectolax(html)
+    else:
+        text = _extract_text_bs4(html)
     
-    # Clean up spaces
-    text = re.sub(r" {2,}", " ", text)
+    # Remove citation brackets and clean up multiple newlines/spaces in one pass
+    text = _CLEAN_RE.sub(_clean_match, text)
     
     return text.strip()
 
@@ -103,37 +182,23 @@ def fetch_wikipedia_content(
         httpx.HTTPError: If the request fails
         ValueError: If the URL is invalid or article not found
     """
-    _rate_limit()
+    _WIKI_LIMITER.acquire()
     
     article_title = _extract_article_title_from_url(wikipedia_url)
     
-    headers = {"User-Agent": USER_AGENT}
+    # The REST endpoint returns the article HTML directly, without a JSON wrapper
+    url = f"{WIKIPEDIA_REST_HTML}/{quote(article_title, safe='')}"
     
-    params = {
-        "action": "parse",
-        "page": article_title,
-        "format": "json",
-        "prop": "text",
-        "disableeditsection": "1",
-        "disabletoc": "1",
-    }
-    
-    with httpx.Client(timeout=timeout) as client:
-        response = client.get(WIKIPEDIA_API, headers=headers, params=params)
+    with _get_client().stream("GET", url, timeout=timeout) as response:
+        if response.status_code == 404:
+            raise ValueError(f"Wikipedia article not found: {article_title}")
         response.raise_for_status()
-        
-        data = response.json()
-        
-        if "error" in data:
-            raise ValueError(f"Wikipedia API error: {data['error'].get('info', 'Unknown error')}")
-        
-        if "parse" not in data or "text" not in data["parse"]:
-            raise ValueError(f"Invalid Wikipedia API response for article: {article_title}")
-        
-        html_content = data["parse"]["text"]["*"]
-        clean_text = _clean_html_to_text(html_content)
-        
-        return article_title, clean_text, html_content
+        response.read()
+    
+    html_content = response.text
+    clean_text = _clean_html_to_text(html_content)
+    
+    return article_title, clean_text, html_content
 
 
 def format_as_document(
@@ -150,18 +215,14 @@ def format_as_document(
     Returns:
         Formatted document with metadata header
     """
-    metadata_header = f"""---
-Source: Wikipedia
-Article: {article_title}
-Entity ID: {entity.id}
-Entity Name: {entity.label}
-URL: {entity.wikipedia_url or 'N/A'}
-Description: {entity.description or 'N/A'}
----
-
-"""
-    
-    return metadata_header + article_text
+    return _DOC_TEMPLATE.format(
+        article=article_title,
+        eid=entity.id,
+        label=entity.label,
+        url=entity.wikipedia_url or "N/A",
+        desc=entity.description or "N/A",
+        body=article_text,
+    )
 
 
 def fetch_wikipedia_source(entity: WikidataEntity, timeout: float = 30.0) -> tuple[Source, str, bytes]:
@@ -1,6 +1,7 @@
 """Storage layer for source database and analysis persistence."""
 
 from .analysis_storage import (
+    LazySourceMap,
     get_analysis_with_sources,
     list_analyses,
     load_analysis,
@@ -10,6 +11,7 @@ from .source_db import SourceDatabase
 
 __all__ = [
     "SourceDatabase",
+    "LazySourceMap",
     "save_analysis",
     "load_analysis",
     "get_analysis_with_sources",
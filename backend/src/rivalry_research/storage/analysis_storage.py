@@ -1,19 +1,169 @@
 """Storage and retrieval for rivalry analyses."""
 
+import functools
 import json
 import logging
+import operator
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard is optional; only needed for compressed analysis files
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
 
 from ..models import RivalryAnalysis, Source
 from .source_db import SourceDatabase
 
 logger = logging.getLogger(__name__)
 
+# analyzed_at is the last field of RivalryAnalysis, so it is serialized as a
+# top-level key (two-space indent) near the end of the file
+_ANALYZED_AT_RE = re.compile(rb'\n  "analyzed_at": "([^"]+)"')
+_ANALYZED_AT_TAIL_BYTES = 4096
+
+# Buffer size for writing analysis files
+_WRITE_BUFFER_SIZE = 65536
+
+# Analysis file names; the compressed variant is only written on request
+_ANALYSIS_FILE = "analysis.json"
+_COMPRESSED_ANALYSIS_FILE = "analysis.json.zst"
+_ZSTD_LEVEL = 3
+
+# Small sidecar written next to each analysis so list_analyses doesn't have
+# to open the (potentially large) analysis file
+_META_FILE = "analysis.meta"
+
+# Worker threads for reading analysis metadata in list_analyses (I/O bound)
+_LIST_MAX_WORKERS = 32
+
+# Number of parsed analyses kept in memory by load_analysis
+_LOAD_CACHE_SIZE = 128
+
+# Built once; dump_json returns the serializer's bytes directly, where
+# model_dump_json decodes them to str (which save_analysis re-encoded)
+_ANALYSIS_ADAPTER = TypeAdapter(RivalryAnalysis)
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_analysis_bytes(path: str | Path) -> bytes:
+    """Read an analysis file, decompressing it if it is zstd-compressed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if str(path).endswith(".zst"):
+        if zstd is None:
+            raise RuntimeError(
+                f"Cannot read compressed analysis {path}: zstandard is not installed"
+            )
+        data = zstd.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _find_analysis_file(analysis_dir: str | Path) -> str | None:
+    """
+    Locate the analysis file in an analysis directory.
+
+    Args:
+        analysis_dir: Directory of a single analysis
+
+    Returns:
+        Path to analysis.json, or to analysis.json.zst if only the compressed
+        file exists; None if neither exists
+    """
+    for name in (_ANALYSIS_FILE, _COMPRESSED_ANALYSIS_FILE):
+        path = os.path.join(analysis_dir, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class LazySourceMap(Mapping[str, Source]):
+    """
+    Read-only sources mapping that loads sources from the database on demand.
+
+    Looking up one key reads just that source (memoized). Iterating, taking
+    the length or serializing loads every remaining source in one batched
+    query; as with eager loading, IDs missing from the database are dropped.
+    """
+
+    def __init__(self, source_ids: Iterable[str], db: SourceDatabase):
+        """
+        Initialize the mapping.
+
+        Args:
+            source_ids: Source IDs referenced by the analysis
+            db: SourceDatabase to load sources from
+        """
+        # dict as an ordered set: keeps the analysis's order for iteration
+        self._ids = dict.fromkeys(source_ids)
+        self._db = db
+        self._cache: dict[str, Source] = {}
+        self._hydrated = False
+
+    def __getitem__(self, source_id: str) -> Source:
+        """Get a source, reading it from the database on first access."""
+        try:
+            return self._cache[source_id]
+        except KeyError:
+            pass
+        if self._hydrated or source_id not in self._ids:
+            raise KeyError(source_id)
+        source = self._db.get_source_by_id(source_id)
+        if source is None:
+            raise KeyError(source_id)
+        self._cache[source_id] = source
+        return source
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.hydrate())
+
+    def __len__(self) -> int:
+        return len(self.hydrate())
+
+    def hydrate(self) -> dict[str, Source]:
+        """
+        Load every source not read yet, in a single query.
+
+        Returns:
+            Dictionary of all sources found in the database, in analysis order
+        """
+        if not self._hydrated:
+            missing = [source_id for source_id in self._ids if source_id not in self._cache]
+            if missing:
+                self._cache.update(self._db.get_sources_by_ids(missing))
+            self._cache = {
+                source_id: self._cache[source_id]
+                for source_id in self._ids
+                if source_id in self._cache
+            }
+            self._hydrated = True
+        return self._cache
+
 
 def save_analysis(
     analysis: RivalryAnalysis,
     analyses_dir: Path,
+    compress: bool = False,
 ) -> Path:
     """
     Save a rivalry analysis to disk as JSON.
@@ -24,34 +174,61 @@ def save_analysis(
     Args:
         analysis: RivalryAnalysis to save
         analyses_dir: Base directory for analyses storage
+        compress: Write zstd-compressed analysis.json.zst instead (requires
+            the zstd extra; falls back to plain JSON without it)
     
     Returns:
         Path to saved analysis file
     """
-    analyses_dir = Path(analyses_dir)
-    
-    # Create analysis directory
+    # Create analysis directory (plain os.path string joins; pathlib's
+    # per-operation parsing isn't needed here)
     analysis_id = f"{analysis.entity1.id}_{analysis.entity2.id}"
-    analysis_path = analyses_dir / analysis_id
-    analysis_path.mkdir(parents=True, exist_ok=True)
+    analysis_path = os.path.join(os.fspath(analyses_dir), analysis_id)
+    os.makedirs(analysis_path, exist_ok=True)
+    
+    # Serialize straight to JSON bytes (no intermediate dict or str), then
+    # write in a single call
+    payload = _ANALYSIS_ADAPTER.dump_json(analysis, indent=2)
     
-    # Save as JSON
-    output_file = analysis_path / "analysis.json"
+    if compress and zstd is None:
+        logger.warning("zstandard is not installed; saving analysis uncompressed")
+        compress = False
     
-    # Convert to dict and handle datetime serialization
-    analysis_dict = analysis.model_dump(mode="json")
+    if compress:
+        output_file = os.path.join(analysis_path, _COMPRESSED_ANALYSIS_FILE)
+        stale_file = os.path.join(analysis_path, _ANALYSIS_FILE)
+        payload = zstd.ZstdCompressor(level=_ZSTD_LEVEL).compress(payload)
+    else:
+        output_file = os.path.join(analysis_path, _ANALYSIS_FILE)
+        stale_file = os.path.join(analysis_path, _COMPRESSED_ANALYSIS_FILE)
     
-    # Write with formatting
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(analysis_dict, f, indent=2, ensure_ascii=False)
+    # Write to a temp file and rename it into place, so readers (e.g. the
+    # frontend) never see a partially written analysis
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+    os.replace(tmp_file, output_file)
+    
+    # Don't leave an older copy in the other format behind
+    try:
+        os.remove(stale_file)
+    except FileNotFoundError:
+        pass
+    
+    _write_metadata(analysis_path, analysis)
     
     logger.info(f"Saved analysis to {output_file}")
-    return output_file
+    return Path(output_file)
 
 
 def load_analysis(analysis_id: str, analyses_dir: Path) -> RivalryAnalysis:
     """
-    Load a rivalry analysis from disk.
+    Load a rivalry analysis from disk (plain or zstd-compressed).
+    
+    Parsed analyses are cached by file path and modification time, so
+    repeated loads of an unchanged file skip the read and parse. Each call
+    returns a shallow copy: reassigning fields is safe, but nested objects
+    are shared with the cache and should not be mutated in place.
     
     Args:
         analysis_id: Analysis identifier (e.g., "Q935_Q9047")
@@ -64,16 +241,31 @@ def load_analysis(analysis_id: str, analyses_dir: Path) -> RivalryAnalysis:
         FileNotFoundError: If analysis file doesn't exist
     """
     analyses_dir = Path(analyses_dir)
-    analysis_file = analyses_dir / analysis_id / "analysis.json"
+    analysis_file = _find_analysis_file(analyses_dir / analysis_id)
     
-    if not analysis_file.exists():
-        raise FileNotFoundError(f"Analysis not found: {analysis_file}")
+    if analysis_file is None:
+        raise FileNotFoundError(
+            f"Analysis not found: {analyses_dir / analysis_id / _ANALYSIS_FILE}"
+        )
     
-    with open(analysis_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    stat = os.stat(analysis_file)
+    analysis = _load_analysis_cached(analysis_file, stat.st_mtime_ns, stat.st_size)
     
     logger.info(f"Loaded analysis from {analysis_file}")
-    return RivalryAnalysis.model_validate(data)
+    return analysis.model_copy()
+
+
+@functools.lru_cache(maxsize=_LOAD_CACHE_SIZE)
+def _load_analysis_cached(
+    analysis_file: str, mtime_ns: int, size: int
+) -> RivalryAnalysis:
+    """
+    Read and parse an analysis file.
+
+    mtime_ns and size are only part of the cache key, so a rewritten file
+    misses the cache.
+    """
+    return RivalryAnalysis.model_validate_json(_read_analysis_bytes(analysis_file))
 
 
 def get_analysis_with_sources(
@@ -84,8 +276,9 @@ def get_analysis_with_sources(
     """
     Load analysis and hydrate sources from SQLite database.
     
-    This is useful if the analysis JSON only has source IDs
-    and you need the full Source objects.
+    Sources are hydrated lazily: each one is read from the database the
+    first time it is accessed, so callers that only touch a few sources
+    don't pay for loading all of them.
     
     Args:
         analysis_id: Analysis identifier (e.g., "Q935_Q9047")
@@ -93,18 +286,14 @@ def get_analysis_with_sources(
         db: SourceDatabase instance
     
     Returns:
-        RivalryAnalysis with fully populated sources
+        RivalryAnalysis whose sources hydrate from the database on access
     """
     analysis = load_analysis(analysis_id, analyses_dir)
     
-    # If sources dict is empty or missing source details, hydrate from DB
     if analysis.sources:
-        source_ids = list(analysis.sources.keys())
-        hydrated_sources = db.get_sources_by_ids(source_ids)
-        
-        # Replace with hydrated sources
-        analysis.sources = hydrated_sources
-        logger.debug(f"Hydrated {len(hydrated_sources)} sources from database")
+        source_ids = list(analysis.sources)
+        analysis.sources = LazySourceMap(source_ids, db)
+        logger.debug(f"Deferred hydration of {len(source_ids)} sources")
     
     return analysis
 
@@ -124,51 +313,160 @@ def list_analyses(analyses_dir: Path) -> list[dict]:
         - path: Path to analysis file
         - analyzed_at: Timestamp of analysis
     """
-    analyses_dir = Path(analyses_dir)
+    analyses_dir = os.fspath(analyses_dir)
     
-    if not analyses_dir.exists():
+    if not os.path.isdir(analyses_dir):
         return []
     
     analyses = []
     
-    for analysis_dir in analyses_dir.iterdir():
-        if not analysis_dir.is_dir():
-            continue
-        
-        analysis_file = analysis_dir / "analysis.json"
-        if not analysis_file.exists():
-            continue
-        
-        # Parse analysis_id (e.g., "Q935_Q9047")
-        analysis_id = analysis_dir.name
-        parts = analysis_id.split("_")
-        
-        if len(parts) != 2:
-            logger.warning(f"Unexpected analysis directory format: {analysis_id}")
-            continue
-        
-        entity1_id, entity2_id = parts
-        
-        # Get timestamp from file
-        try:
-            with open(analysis_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                analyzed_at = data.get("analyzed_at")
-        except Exception as e:
-            logger.warning(f"Could not read analysis metadata for {analysis_id}: {e}")
-            analyzed_at = None
+    # os.scandir caches the entry type, avoiding a stat per directory
+    with os.scandir(analyses_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            
+            analysis_file = _find_analysis_file(entry.path)
+            if analysis_file is None:
+                continue
+            
+            # Parse analysis_id (e.g., "Q935_Q9047")
+            analysis_id = entry.name
+            entity1_id, sep, entity2_id = analysis_id.partition("_")
+            
+            if not sep or "_" in entity2_id:
+                logger.warning(f"Unexpected analysis directory format: {analysis_id}")
+                continue
+            
+            analyses.append({
+                "analysis_id": analysis_id,
+                "entity1_id": entity1_id,
+                "entity2_id": entity2_id,
+                "path": analysis_file,
+                "_dir": entry.path,
+            })
+    
+    # Read timestamps concurrently; each read is a small, I/O-bound file access
+    if analyses:
+        max_workers = min(_LIST_MAX_WORKERS, len(analyses))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            metadata = list(executor.map(_read_listing_metadata, analyses))
         
-        analyses.append({
-            "analysis_id": analysis_id,
-            "entity1_id": entity1_id,
-            "entity2_id": entity2_id,
-            "path": str(analysis_file),
-            "analyzed_at": analyzed_at,
-        })
+        for analysis, (analyzed_at, sort_key) in zip(analyses, metadata):
+            del analysis["_dir"]
+            analysis["analyzed_at"] = analyzed_at
+            analysis["_sort_key"] = sort_key
     
-    # Sort by analyzed_at (most recent first)
-    analyses.sort(key=lambda x: x["analyzed_at"] or "", reverse=True)
+    # Sort by analyzed_at (most recent first), comparing pre-parsed integers
+    analyses.sort(key=operator.itemgetter("_sort_key"), reverse=True)
+    for analysis in analyses:
+        del analysis["_sort_key"]
     
     logger.info(f"Found {len(analyses)} saved analyses")
     return analyses
 
+
+def _read_listing_metadata(analysis: dict) -> tuple[str | None, int]:
+    """Read metadata for a list_analyses record, logging instead of raising."""
+    try:
+        return _read_metadata(analysis["_dir"], analysis["path"])
+    except Exception as e:
+        logger.warning(
+            f"Could not read analysis metadata for {analysis['analysis_id']}: {e}"
+        )
+        return None, 0
+
+
+def _write_metadata(analysis_path: str, analysis: RivalryAnalysis) -> None:
+    """
+    Write the analysis.meta sidecar for a saved analysis.
+
+    Args:
+        analysis_path: Directory of the analysis
+        analysis: The saved analysis
+    """
+    analyzed_at = analysis.model_dump(mode="json", include={"analyzed_at"})["analyzed_at"]
+    meta = {
+        "analyzed_at": analyzed_at,
+        "analyzed_at_us": _timestamp_sort_key(analyzed_at),
+        "entity1_id": analysis.entity1.id,
+        "entity2_id": analysis.entity2.id,
+    }
+    with open(os.path.join(analysis_path, _META_FILE), "wb") as f:
+        f.write(json.dumps(meta).encode("utf-8"))
+
+
+def _read_metadata(analysis_path: str, analysis_file: str) -> tuple[str | None, int]:
+    """
+    Get an analysis's timestamp and sort key.
+
+    Uses the analysis.meta sidecar when present; analyses saved before
+    sidecars existed fall back to reading the analysis file.
+
+    Args:
+        analysis_path: Directory of the analysis
+        analysis_file: Path to the analysis file
+
+    Returns:
+        Tuple of (ISO timestamp or None, integer sort key)
+    """
+    try:
+        with open(os.path.join(analysis_path, _META_FILE), "rb") as f:
+            meta = _parse_json(f.read())
+        return meta["analyzed_at"], meta["analyzed_at_us"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    analyzed_at = _read_analyzed_at(analysis_file)
+    return analyzed_at, _timestamp_sort_key(analyzed_at)
+
+
+def _timestamp_sort_key(analyzed_at: str | None) -> int:
+    """
+    Convert an ISO timestamp to integer microseconds since the epoch.
+
+    Args:
+        analyzed_at: ISO timestamp string, or None
+
+    Returns:
+        Sort key; 0 for missing or unparseable timestamps
+    """
+    if not analyzed_at:
+        return 0
+    try:
+        return int(datetime.fromisoformat(analyzed_at).timestamp() * 1_000_000)
+    except ValueError:
+        return 0
+
+
+def _read_analyzed_at(analysis_file: str) -> str | None:
+    """
+    Read the analyzed_at timestamp without parsing the whole analysis.
+
+    Scans the tail of the file for the top-level key and only falls back to
+    a full JSON parse if it isn't found there. Compressed files have to be
+    decompressed first, so only the parse is skipped for them.
+
+    Args:
+        analysis_file: Path to analysis.json or analysis.json.zst
+
+    Returns:
+        ISO timestamp string, or None if not present
+    """
+    if analysis_file.endswith(".zst"):
+        data = _read_analysis_bytes(analysis_file)
+        tail = data[-_ANALYZED_AT_TAIL_BYTES:]
+    else:
+        data = None
+        with open(analysis_file, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - _ANALYZED_AT_TAIL_BYTES))
+            tail = f.read()
+
+    matches = _ANALYZED_AT_RE.findall(tail)
+    if matches:
+        return matches[-1].decode("utf-8")
+
+    if data is None:
+        data = _read_analysis_bytes(analysis_file)
+    return _parse_json(data).get("analyzed_at")
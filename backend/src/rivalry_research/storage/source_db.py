@@ -1,14 +1,61 @@
 """SQLite database for source deduplication and management."""
 
+import json
 import logging
 import sqlite3
+import sys
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+# orjson is optional; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models import Source
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of URL lookups memoized per SourceDatabase instance
+_URL_CACHE_MAX_SIZE = 65536
+
+# Hot queries are kept as module constants so each maps to one entry in the
+# connection's prepared statement cache
+# Columns read into Source objects, in the order _row_to_source unpacks them
+_SOURCE_COLUMNS = (
+    "source_id, type, title, authors, publication, publication_date, url, doi, "
+    "isbn, retrieved_at, credibility_score, is_primary_source, "
+    "stored_content_path, content_hash, is_manual"
+)
+_URL_COLUMN_INDEX = 6
+
+# Maximum bound parameters per IN (...) query; larger lookups are chunked
+# (older SQLite builds cap a statement at 999 variables)
+_MAX_IN_PARAMS = 500
+
+_SELECT_SOURCES_SQL = f"SELECT {_SOURCE_COLUMNS} FROM sources"
+_SELECT_BY_URL_SQL = f"{_SELECT_SOURCES_SQL} WHERE url = ?"
+_SELECT_BY_ID_SQL = f"{_SELECT_SOURCES_SQL} WHERE source_id = ?"
+_COUNT_SQL = "SELECT COUNT(*) FROM sources"
+_COUNT_BY_TYPE_SQL = "SELECT type, COUNT(*) as count FROM sources GROUP BY type"
+_COUNT_PRIMARY_SQL = "SELECT COUNT(*) FROM sources WHERE is_primary_source = 1"
+
+_INSERT_SOURCE_SQL = """
+    INSERT INTO sources (
+        source_id, type, title, authors, publication, publication_date,
+        url, doi, isbn, retrieved_at, credibility_score, is_primary_source,
+        stored_content_path, content_hash, is_manual
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Inserts unless the URL already exists, returning a row only for new sources
+_UPSERT_SOURCE_SQL = _INSERT_SOURCE_SQL + """    ON CONFLICT(url) DO NOTHING
+    RETURNING source_id
+"""
+
 
 class SourceDatabase:
     """Manages SQLite database for source storage and deduplication."""
@@ -22,12 +69,29 @@ class SourceDatabase:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # URL -> Source (or None if absent), kept in sync by add_source
+        self._url_cache: dict[str, Source | None] = {}
+        
+        # One connection for the lifetime of the instance, in autocommit mode
+        # (transactions are explicit). The lock serializes access across threads
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._lock = threading.Lock()
         self._create_schema()
 
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     def _create_schema(self) -> None:
         """Create database schema if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        with self._lock:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS sources (
                     source_id TEXT PRIMARY KEY,
                     type TEXT NOT NULL,
@@ -48,17 +112,34 @@ class SourceDatabase:
                 )
             """)
             
-            # Create index on URL for fast deduplication checks
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_sources_url ON sources(url)
-            """)
+            # Databases created before is_manual was added lack the column
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(sources)")
+            }
+            if "is_manual" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE sources ADD COLUMN is_manual INTEGER DEFAULT 0"
+                )
+            
+            # URL lookups use the index SQLite creates for the UNIQUE constraint
+            # (the planner prefers it for url = ? even over a covering index);
+            # a separate url index only adds write cost, so drop it from older
+            # databases
+            self._conn.execute("DROP INDEX IF EXISTS idx_sources_url")
             
             # Create index on content_hash for additional deduplication
-            conn.execute("""
+            self._conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_sources_hash ON sources(content_hash)
             """)
             
-            conn.commit()
+            # WAL lets readers proceed during writes and, with synchronous=NORMAL,
+            # avoids an fsync per committed transaction. journal_mode persists
+            # in the database file; the other pragmas apply per connection
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+            self._conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
             logger.debug(f"Database schema initialized at {self.db_path}")
 
     def get_source_by_url(self, url: str) -> Source | None:
@@ -71,17 +152,17 @@ class SourceDatabase:
         Returns:
             Source object if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM sources WHERE url = ?",
-                (url,)
-            )
+        if url in self._url_cache:
+            return self._url_cache[url]
+
+        with self._lock:
+            cursor = self._conn.execute(_SELECT_BY_URL_SQL, (url,))
             row = cursor.fetchone()
             
-            if row:
-                return self._row_to_source(row)
-            return None
+            source = self._row_to_source(row) if row else None
+
+        self._cache_url(url, source)
+        return source
 
     def get_source_by_id(self, source_id: str) -> Source | None:
         """
@@ -93,12 +174,8 @@ class SourceDatabase:
         Returns:
             Source object if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM sources WHERE source_id = ?",
-                (source_id,)
-            )
+        with self._lock:
+            cursor = self._conn.execute(_SELECT_BY_ID_SQL, (source_id,))
             row = cursor.fetchone()
             
             if row:
@@ -118,18 +195,45 @@ class SourceDatabase:
         if not source_ids:
             return {}
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            placeholders = ",".join("?" * len(source_ids))
-            cursor = conn.execute(
-                f"SELECT * FROM sources WHERE source_id IN ({placeholders})",
-                source_ids
-            )
-            
-            return {
-                row["source_id"]: self._row_to_source(row)
-                for row in cursor.fetchall()
-            }
+        with self._lock:
+            rows = self._select_where_in("source_id", source_ids)
+        
+        return {row[0]: self._row_to_source(row) for row in rows}
+
+    def get_sources_by_urls(self, urls: list[str]) -> dict[str, Source]:
+        """
+        Retrieve multiple sources by their URLs in a single query.
+
+        Args:
+            urls: List of source URLs
+
+        Returns:
+            Dictionary mapping URL to Source object (missing URLs are omitted)
+        """
+        sources: dict[str, Source] = {}
+        missing: list[str] = []
+
+        for url in urls:
+            if url in self._url_cache:
+                cached = self._url_cache[url]
+                if cached:
+                    sources[url] = cached
+            else:
+                missing.append(url)
+
+        if not missing:
+            return sources
+
+        with self._lock:
+            rows = self._select_where_in("url", missing)
+
+        for row in rows:
+            sources[row[_URL_COLUMN_INDEX]] = self._row_to_source(row)
+
+        for url in missing:
+            self._cache_url(url, sources.get(url))
+
+        return sources
 
     def add_source(self, source: Source) -> Source:
         """
@@ -143,47 +247,89 @@ class SourceDatabase:
         Returns:
             The added source (or existing source if URL duplicate)
         """
-        # Check if URL already exists
-        existing = self.get_source_by_url(source.url)
-        if existing:
+        # URLs already looked up by this instance skip the database entirely
+        cached = self._url_cache.get(source.url)
+        if cached:
+            logger.debug(f"Source URL already exists: {source.url} (ID: {cached.source_id})")
+            return cached
+        
+        # Insert and URL check in one atomic statement; a returned row means
+        # the source was new
+        with self._lock:
+            inserted = self._conn.execute(
+                _UPSERT_SOURCE_SQL, self._source_to_row(source)
+            ).fetchall()
+            if not inserted:
+                row = self._conn.execute(_SELECT_BY_URL_SQL, (source.url,)).fetchone()
+                existing = self._row_to_source(row)
+        
+        if not inserted:
             logger.debug(f"Source URL already exists: {source.url} (ID: {existing.source_id})")
+            self._cache_url(source.url, existing)
             return existing
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Convert authors list to JSON string
-            authors_json = ",".join(source.authors) if source.authors else ""
-            
-            conn.execute(
-                """
-                INSERT INTO sources (
-                    source_id, type, title, authors, publication, publication_date,
-                    url, doi, isbn, retrieved_at, credibility_score, is_primary_source,
-                    stored_content_path, content_hash, is_manual
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    source.source_id,
-                    source.type,
-                    source.title,
-                    authors_json,
-                    source.publication,
-                    source.publication_date,
-                    source.url,
-                    source.doi,
-                    source.isbn,
-                    source.retrieved_at,
-                    source.credibility_score,
-                    1 if source.is_primary_source else 0,
-                    source.stored_content_path,
-                    source.content_hash,
-                    1 if source.is_manual else 0,
-                )
-            )
-            conn.commit()
-            logger.debug(f"Added new source: {source.source_id} - {source.title}")
-        
+        logger.debug(f"Added new source: {source.source_id} - {source.title}")
+        self._cache_url(source.url, source)
         return source
 
+    def add_sources(self, sources: Iterable[Source]) -> list[Source]:
+        """
+        Add multiple sources to the database in a single transaction.
+
+        Performs deduplication by URL, both against the database and within
+        the given sources. The existence check and the inserts run in the same
+        write transaction, so concurrent writers cannot insert a duplicate URL
+        in between.
+
+        Args:
+            sources: Source objects to add
+
+        Returns:
+            Sources in input order; existing sources replace URL duplicates
+        """
+        sources = list(sources)
+        if not sources:
+            return []
+
+        urls = list({source.url: None for source in sources})
+
+        results: list[Source] = []
+        new_sources: list[Source] = []
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                existing = {
+                    row[_URL_COLUMN_INDEX]: self._row_to_source(row)
+                    for row in self._select_where_in("url", urls)
+                }
+
+                for source in sources:
+                    if source.url in existing:
+                        results.append(existing[source.url])
+                        continue
+                    existing[source.url] = source
+                    new_sources.append(source)
+                    results.append(source)
+
+                self._conn.executemany(
+                    _INSERT_SOURCE_SQL,
+                    [self._source_to_row(source) for source in new_sources]
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+        for source in results:
+            self._cache_url(source.url, source)
+
+        logger.debug(
+            f"Added {len(new_sources)} new sources "
+            f"({len(sources) - len(new_sources)} already existed)"
+        )
+        return results
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get statistics about stored sources.
@@ -191,18 +337,14 @@ class SourceDatabase:
         Returns:
             Dictionary with counts and statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM sources")
+        with self._lock:
+            cursor = self._conn.execute(_COUNT_SQL)
             total = cursor.fetchone()[0]
             
-            cursor = conn.execute(
-                "SELECT type, COUNT(*) as count FROM sources GROUP BY type"
-            )
+            cursor = self._conn.execute(_COUNT_BY_TYPE_SQL)
             by_type = {row[0]: row[1] for row in cursor.fetchall()}
             
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM sources WHERE is_primary_source = 1"
-            )
+            cursor = self._conn.execute(_COUNT_PRIMARY_SQL)
             primary_count = cursor.fetchone()[0]
             
             return {
@@ -212,35 +354,119 @@ class SourceDatabase:
                 "secondary_sources": total - primary_count,
             }
 
-    def _row_to_source(self, row: sqlite3.Row) -> Source:
+    def _select_where_in(self, column: str, values: list[str]) -> list[tuple]:
+        """
+        Select source rows whose column matches any of the values.
+
+        Queries in chunks of _MAX_IN_PARAMS values. The caller must hold
+        self._lock.
+
+        Args:
+            column: Column to match ("source_id" or "url")
+            values: Values to look up
+
+        Returns:
+            Matching rows
+        """
+        rows: list[tuple] = []
+        for start in range(0, len(values), _MAX_IN_PARAMS):
+            chunk = values[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"{_SELECT_SOURCES_SQL} WHERE {column} IN ({placeholders})",
+                chunk
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def _source_to_row(self, source: Source) -> tuple:
+        """
+        Convert Source model to a row tuple for _INSERT_SOURCE_SQL.
+
+        Args:
+            source: Source object
+
+        Returns:
+            Tuple of column values
+        """
+        # Store authors as a JSON array so names containing commas round-trip
+        authors_str = json.dumps(source.authors, ensure_ascii=False)
+
+        return (
+            source.source_id,
+            source.type,
+            source.title,
+            authors_str,
+            source.publication,
+            source.publication_date,
+            source.url,
+            source.doi,
+            source.isbn,
+            source.retrieved_at,
+            source.credibility_score,
+            1 if source.is_primary_source else 0,
+            source.stored_content_path,
+            source.content_hash,
+            1 if source.is_manual else 0,
+        )
+
+    def _cache_url(self, url: str, source: Source | None) -> None:
+        """
+        Memoize a URL lookup result, evicting the oldest entry when full.
+
+        Args:
+            url: Source URL
+            source: Source found for the URL, or None if not in the database
+        """
+        if url not in self._url_cache and len(self._url_cache) >= _URL_CACHE_MAX_SIZE:
+            # Dicts preserve insertion order, so the first key is the oldest
+            del self._url_cache[next(iter(self._url_cache))]
+        self._url_cache[url] = source
+
+    def _row_to_source(self, row: tuple) -> Source:
         """
         Convert database row to Source model.
 
         Args:
-            row: SQLite row object
+            row: Row tuple with columns in _SOURCE_COLUMNS order
 
         Returns:
             Source object
         """
-        # Parse authors from comma-separated string
-        authors_str = row["authors"] or ""
-        authors = [a.strip() for a in authors_str.split(",") if a.strip()]
+        (
+            source_id, source_type, title, authors_str, publication,
+            publication_date, url, doi, isbn, retrieved_at, credibility_score,
+            is_primary_source, stored_content_path, content_hash, is_manual,
+        ) = row
+
+        authors = None
+        if authors_str and authors_str.startswith("["):
+            try:
+                authors = orjson.loads(authors_str) if orjson is not None else json.loads(authors_str)
+            except ValueError:
+                # A legacy row whose first author starts with "[" (e.g.
+                # "[Anonymous], J. Smith"); both decoders' errors are ValueErrors
+                pass
+        if authors is None:
+            # Rows written before authors were stored as JSON are comma-separated
+            authors = [a for a in (s.strip() for s in (authors_str or "").split(",")) if a]
         
-        return Source(
-            source_id=row["source_id"],
-            type=row["type"],
-            title=row["title"],
+        # Rows are only ever written from validated Source models. sqlite3
+        # returns a new string per row, so share the few type values.
+        return Source.from_trusted(
+            source_id=source_id,
+            type=sys.intern(source_type),
+            title=title,
             authors=authors,
-            publication=row["publication"],
-            publication_date=row["publication_date"],
-            url=row["url"],
-            doi=row["doi"],
-            isbn=row["isbn"],
-            retrieved_at=row["retrieved_at"],
-            credibility_score=row["credibility_score"],
-            is_primary_source=bool(row["is_primary_source"]),
-            stored_content_path=row["stored_content_path"],
-            content_hash=row["content_hash"],
-            is_manual=bool(row.get("is_manual", 0)),
+            publication=publication,
+            publication_date=publication_date,
+            url=url,
+            doi=doi,
+            isbn=isbn,
+            retrieved_at=retrieved_at,
+            credibility_score=credibility_score,
+            is_primary_source=bool(is_primary_source),
+            stored_content_path=stored_content_path,
+            content_hash=content_hash,
+            is_manual=bool(is_manual),
         )
-